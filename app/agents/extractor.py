@@ -356,7 +356,6 @@ def _build_fallback_url(title: str, site_key: str) -> str:
     """Generate a search URL for the product on the given marketplace.
     Used when no direct product URL was extracted.
     """
-    from urllib.parse import quote_plus
     cfg = marketplace_registry.get(site_key)
     if not cfg or not cfg.search_url_pattern:
         return ""
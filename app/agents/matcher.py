@@ -234,9 +234,8 @@ async def run_matcher(state: PipelineState) -> PipelineState:
 
     target     = state.normalized_product
     min_score  = 0.4
-    prefs      = getattr(state, "preferences", None)
-    if prefs and hasattr(prefs, "min_match_score") and prefs.min_match_score > 0:
-        min_score = prefs.min_match_score
+    if state.preferences.min_match_score > 0:
+        min_score = state.preferences.min_match_score
 
     matched = []
     rejected_count = 0
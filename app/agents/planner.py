@@ -1,6 +1,9 @@
 from __future__ import annotations
+import asyncio
 import re
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
+
+from cachetools import TTLCache
 
 from app.schemas import NormalizedProduct, ProductAttributes
 from app.marketplaces.registry import marketplace_registry, MarketplaceConfig
@@ -92,14 +95,40 @@ Rules:
     return attrs, search_query
 
 
+# ── Parsed-query cache ────────────────────────────────────────────────────────
+# The LLM parse depends only on the query text, so repeat searches (and the
+# matcher's retry passes through the planner) reuse it for an hour.  Concurrent
+# identical queries share one in-flight call.  Failed parses aren't cached.
+_PARSE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_PARSE_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+async def _cached_llm_parse(query: str) -> Optional[Tuple[ProductAttributes, str]]:
+    key = " ".join(query.lower().split())
+    hit = _PARSE_CACHE.get(key)
+    if hit is None:
+        task = _PARSE_INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_llm_parse(query))
+            _PARSE_INFLIGHT[key] = task
+            task.add_done_callback(lambda _t: _PARSE_INFLIGHT.pop(key, None))
+        hit = await asyncio.shield(task)
+        if hit is None:
+            return None
+        _PARSE_CACHE[key] = hit
+    # Callers mutate attrs on retry, so hand out a copy of the cached entry
+    attrs, search_query = hit
+    return attrs.model_copy(update={"raw_query": query}), search_query
+
+
 def _select_marketplaces(request, brand: Optional[str]) -> List[MarketplaceConfig]:
     if request.allowed_marketplaces:
         selected = marketplace_registry.filter_by_keys(request.allowed_marketplaces)
         if not selected:
             logger.warning("allowed_marketplaces matched nothing — using all enabled")
-            selected = marketplace_registry.all_enabled()
+            selected = list(marketplace_registry.all_enabled())
     else:
-        selected = marketplace_registry.all_enabled()
+        selected = list(marketplace_registry.all_enabled())
 
     # Brand affinity filter (e.g. Samsung Shop only for Samsung queries)
     if brand:
@@ -117,7 +146,7 @@ def _select_marketplaces(request, brand: Optional[str]) -> List[MarketplaceConfi
     # Never return empty
     if not selected:
         logger.warning("Brand filter emptied marketplace list — fallback to all enabled")
-        selected = marketplace_registry.all_enabled()
+        selected = list(marketplace_registry.all_enabled())
 
     logger.info(f"Selected {len(selected)} markets: {[m.key for m in selected]}")
     return selected
@@ -133,7 +162,7 @@ async def run_planner(state: PipelineState) -> PipelineState:
         return state
 
     # LLM parse → regex fallback
-    llm_result = await _llm_parse(query)
+    llm_result = await _cached_llm_parse(query)
     if llm_result:
         attrs, search_query = llm_result
         logger.info(f"Planner [LLM]: {attrs.brand} | {attrs.model} | {attrs.storage} → '{search_query}'")
@@ -201,7 +230,7 @@ async def planner_node(state: dict) -> dict:
         }
 
     # Parse query with LLM → regex fallback
-    llm_result = await _llm_parse(query)
+    llm_result = await _cached_llm_parse(query)
     if llm_result:
         attrs, search_query = llm_result
         logger.info(
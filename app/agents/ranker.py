@@ -17,11 +17,11 @@ SCORE NORMALIZATION:
   Rating score:   offer_rating / 5.0
   Delivery score: 1 / delivery_days
 """
+import asyncio
 import logging
 from typing import List, Optional
 from app.schemas import (
-    NormalizedOffer, ScoreBreakdown, PipelineState,
-    RankingPreferences, RankingMode,
+    NormalizedOffer, ScoreBreakdown, PipelineState, RankingMode,
 )
 
 logger = logging.getLogger("ranker")
@@ -167,10 +167,7 @@ def _rank_offers(offers: List[NormalizedOffer], mode: RankingMode) -> List[Norma
 # ── SYNC backward-compat entry point ─────────────────────────────────────────
 
 def run_ranker(state: PipelineState) -> PipelineState:
-    prefs: RankingPreferences = (
-        getattr(state, "preferences", None) or RankingPreferences()
-    )
-    mode = prefs.mode_enum()
+    mode = state.preferences.mode_enum()
 
     ranked = _rank_offers(state.matched_offers, mode)
     state.ranked_offers = ranked
@@ -183,8 +180,12 @@ def run_ranker(state: PipelineState) -> PipelineState:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def ranker_node(state: dict) -> dict:
-    """LangGraph node: Stage 5 — Score, rank, badge, deduplicate offers."""
+async def ranker_node(state: dict) -> dict:
+    """LangGraph node: Stage 5 — Score, rank, badge, deduplicate offers.
+
+    LangGraph calls sync nodes inline on the event loop, so the scoring and
+    sorting pass is pushed to a worker thread instead.
+    """
     matched = state.get("matched_results", [])
     mode_str = state.get("mode", "balanced")
 
@@ -193,7 +194,7 @@ def ranker_node(state: dict) -> dict:
     except ValueError:
         mode = RankingMode.balanced
 
-    ranked = _rank_offers(matched, mode)
+    ranked = await asyncio.to_thread(_rank_offers, matched, mode)
 
     logger.info("Ranker node: %d matched → %d ranked", len(matched), len(ranked))
 
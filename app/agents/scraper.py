@@ -15,8 +15,10 @@ All browser operations are guarded by a shared semaphore (max 3 concurrent).
 """
 from __future__ import annotations
 import asyncio
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List
 
+from app.config import settings
 from app.agents import PipelineState
 from app.schemas import RawListing, SiteStatus, SiteStatusCode
 from app.marketplaces.registry import marketplace_registry, MarketplaceConfig
@@ -32,7 +34,7 @@ _BROWSER_SEMAPHORE = None
 def _get_browser_semaphore() -> asyncio.Semaphore:
     global _BROWSER_SEMAPHORE
     if _BROWSER_SEMAPHORE is None:
-        _BROWSER_SEMAPHORE = asyncio.Semaphore(3)
+        _BROWSER_SEMAPHORE = asyncio.Semaphore(max(1, settings.scraper_max_concurrent))
     return _BROWSER_SEMAPHORE
 
 
@@ -59,9 +61,13 @@ def _get_dedicated_scraper(site_key: str):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+@lru_cache(maxsize=None)
 def make_scraper_node(site_key: str):
     """Factory: creates a LangGraph async node function for a specific site.
 
+    Cached per site_key, so graph rebuilds and run_scraper() reuse the
+    same node function instead of rebuilding the closure each time.
+
     Each node checks target_sites FIRST (Constraint #11).
     If not in target_sites → returns empty results immediately.
     All browser operations use async/await (Constraint #12).
@@ -164,12 +170,22 @@ async def run_scraper(state: PipelineState) -> PipelineState:
         query, len(site_keys), site_keys,
     )
 
-    from app.scraping.sgai_scraper import run_sgai_orchestrator
-    listings, statuses = await run_sgai_orchestrator(
-        search_query=query,
-        marketplace_keys=site_keys,
-        max_results_per_site=5,
-    )
+    # Fan out one scraper node per site — the shared browser semaphore inside
+    # each node bounds concurrency, so total latency ≈ max(site latencies).
+    # Nodes catch their own errors and report them as an ERROR SiteStatus.
+    results = await asyncio.gather(*[
+        make_scraper_node(k)({
+            "target_sites": [k],
+            "normalized_product": state.normalized_product,
+        })
+        for k in site_keys
+    ])
+
+    listings: List[RawListing] = []
+    statuses: List[SiteStatus] = []
+    for result in results:
+        listings.extend(result.get("raw_results", []))
+        statuses.extend(result.get("site_statuses", []))
 
     state.raw_listings = listings
     for s in statuses:
@@ -6,12 +6,9 @@ Calls Groq Llama 3.3 70B to classify user messages into one of 4 intents.
 """
 from __future__ import annotations
 
-import asyncio
-import json
+import orjson
 
-from groq import Groq
-
-from app.config import settings
+from app.utils.llm_client import chat_completion
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,25 +44,19 @@ async def classify_intent(message: str) -> str:
     Falls back to "product_search" on any failure (safest default).
     """
     try:
-        client = Groq(api_key=settings.groq_api_key)
-
-        def _call_groq():
-            return client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": message},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-                max_tokens=50,
-            )
-
-        loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(None, _call_groq)
+        resp = await chat_completion(
+            model="llama-3.3-70b-versatile",
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": message},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1,
+            max_tokens=50,
+        )
 
         raw = resp.choices[0].message.content.strip()
-        data = json.loads(raw)
+        data = orjson.loads(raw)
         intent = data.get("intent", "").lower().strip()
 
         if intent in _VALID_INTENTS:
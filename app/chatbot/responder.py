@@ -7,13 +7,10 @@ to generate conversational shopping assistant responses.
 """
 from __future__ import annotations
 
-import asyncio
 from typing import List
 
-from groq import Groq
-
 from app.chatbot.schemas import ShoppingResult
-from app.config import settings
+from app.utils.llm_client import chat_completion
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,22 +27,16 @@ _FALLBACK_RESPONSE = "I'm having trouble right now. Please try again in a moment
 
 
 def _format_products_context(products: List[ShoppingResult]) -> str:
-    """Format product data as text context for the LLM."""
-    lines = []
-    for i, p in enumerate(products[:10], 1):
-        parts = [f"{i}. {p.title}"]
-        if p.price:
-            parts.append(f"Price: {p.price}")
-        if p.rating is not None:
-            parts.append(f"Rating: {p.rating}/5")
-        if p.reviews is not None:
-            parts.append(f"Reviews: {p.reviews}")
-        if p.source:
-            parts.append(f"Store: {p.source}")
-        if p.delivery:
-            parts.append(f"Delivery: {p.delivery}")
-        lines.append(" | ".join(parts))
-    return "\n".join(lines)
+    """Format product data as text context for the LLM (single pass, no per-row lists)."""
+    return "\n".join(
+        f"{i}. {p.title}"
+        + (f" | Price: {p.price}" if p.price else "")
+        + (f" | Rating: {p.rating}/5" if p.rating is not None else "")
+        + (f" | Reviews: {p.reviews}" if p.reviews is not None else "")
+        + (f" | Store: {p.source}" if p.source else "")
+        + (f" | Delivery: {p.delivery}" if p.delivery else "")
+        for i, p in enumerate(products[:10], 1)
+    )
 
 
 def _build_user_prompt(
@@ -123,33 +114,24 @@ async def generate_response(
     Returns a clean text string. On failure, returns a safe fallback message.
     """
     try:
-        client = Groq(api_key=settings.groq_api_key)
-
         # Build messages array: system → last 4 history → current user prompt
         messages = [{"role": "system", "content": _SYSTEM_PROMPT}]
 
-        # Add last 4 messages from chat history
-        recent_history = chat_history[-4:] if chat_history else []
-        for msg in recent_history:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            if role in ("user", "assistant") and content:
-                messages.append({"role": role, "content": content})
+        # Chat history is already filtered + trimmed to the last 4 by ChatRequest
+        messages.extend(
+            {"role": m["role"], "content": m["content"]} for m in chat_history
+        )
 
         # Build and append current user prompt
         user_prompt = _build_user_prompt(message, products, intent)
         messages.append({"role": "user", "content": user_prompt})
 
-        def _call_groq():
-            return client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=300,
-            )
-
-        loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(None, _call_groq)
+        resp = await chat_completion(
+            model="llama-3.3-70b-versatile",
+            messages=messages,
+            temperature=0.7,
+            max_tokens=300,
+        )
 
         response_text = resp.choices[0].message.content.strip()
         logger.info(
@@ -5,6 +5,7 @@ Completely independent from Feature 1 schemas.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
@@ -27,14 +28,29 @@ class ChatRequest(BaseModel):
     @field_validator("chat_history", mode="before")
     @classmethod
     def trim_history(cls, v: List[dict]) -> List[dict]:
-        """Keep only the last 20 messages."""
-        if isinstance(v, list) and len(v) > 20:
-            return v[-20:]
-        return v
+        """Keep only the last 4 user/assistant messages that have content.
 
+        The responder sends this list to the LLM as-is, so filtering and
+        slicing happen once here instead of on every chat turn.
+        """
+        if not isinstance(v, list):
+            return v
+        v = [
+            m for m in v
+            if isinstance(m, dict)
+            and m.get("role") in ("user", "assistant")
+            and m.get("content")
+        ]
+        return v[-4:]
 
-class ShoppingResult(BaseModel):
-    """A single product card returned from SerpAPI Google Shopping."""
+
+@dataclass(slots=True, frozen=True)
+class ShoppingResult:
+    """A single product card returned from SerpAPI Google Shopping.
+
+    Plain slotted dataclass — built 10× per SerpAPI call on the hot path.
+    Field coercion (e.g. float reviews) happens in fetch_shopping_results().
+    """
 
     title: str
     price: Optional[str] = None
@@ -45,17 +61,6 @@ class ShoppingResult(BaseModel):
     thumbnail: Optional[str] = None
     link: Optional[str] = None
 
-    @field_validator("reviews", mode="before")
-    @classmethod
-    def coerce_reviews(cls, v):
-        """SerpAPI sometimes returns reviews as float (e.g., 3523.0)."""
-        if v is None:
-            return None
-        try:
-            return int(v)
-        except (ValueError, TypeError):
-            return None
-
 
 class ChatResponse(BaseModel):
     """Response sent back to the frontend."""
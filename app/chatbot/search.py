@@ -7,8 +7,9 @@ Returns empty list on failure — never raises exceptions.
 """
 from __future__ import annotations
 
-import asyncio
-from typing import List
+from typing import List, Optional
+
+import httpx
 
 from app.chatbot.schemas import ShoppingResult
 from app.config import settings
@@ -16,6 +17,42 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SERPAPI_URL = "https://serpapi.com/search.json"
+
+# Shared async client — keeps SerpAPI connections warm across chat turns.
+# Created on first use; close_http_client() drops it from lifespan shutdown
+# so the next startup opens a fresh one.
+_HTTP: Optional[httpx.AsyncClient] = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    global _HTTP
+    if _HTTP is None:
+        _HTTP = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _HTTP
+
+
+async def close_http_client() -> None:
+    """Close the shared SerpAPI HTTP client. Call from lifespan shutdown."""
+    global _HTTP
+    if _HTTP is not None:
+        client, _HTTP = _HTTP, None
+        await client.aclose()
+
+
+def _coerce_reviews(v) -> Optional[int]:
+    """SerpAPI sometimes returns reviews as float (e.g., 3523.0)."""
+    if v is None:
+        return None
+    try:
+        return int(v)
+    except (ValueError, TypeError):
+        return None
+
 
 async def fetch_shopping_results(message: str, intent: str) -> List[ShoppingResult]:
     """Fetch Google Shopping results via SerpAPI.
@@ -29,8 +66,6 @@ async def fetch_shopping_results(message: str, intent: str) -> List[ShoppingResu
         return []
 
     try:
-        from serpapi import GoogleSearch
-
         api_key = settings.serpapi_key.strip()
         if not api_key:
             logger.error("SERPAPI_KEY not set in .env — cannot fetch shopping results")
@@ -45,10 +80,16 @@ async def fetch_shopping_results(message: str, intent: str) -> List[ShoppingResu
             "num": 10,
         }
 
-        # Run blocking SerpAPI call in thread pool to keep async
-        loop = asyncio.get_event_loop()
-        search = GoogleSearch(params)
-        results = await loop.run_in_executor(None, search.get_dict)
+        # Direct async GET — SerpAPI's JSON endpoint, no SDK / thread hop
+        resp = await _get_http().get(_SERPAPI_URL, params=params)
+        if resp.status_code >= 400:
+            # Status only — the request URL carries api_key
+            logger.error(
+                "SerpAPI fetch failed: HTTP %d %s",
+                resp.status_code, resp.reason_phrase,
+            )
+            return []
+        results = resp.json()
 
         shopping_results = results.get("shopping_results", [])
 
@@ -83,7 +124,7 @@ async def fetch_shopping_results(message: str, intent: str) -> List[ShoppingResu
                     title=item.get("title", ""),
                     price=item.get("price", None),
                     rating=item.get("rating", None),
-                    reviews=item.get("reviews", None),
+                    reviews=_coerce_reviews(item.get("reviews")),
                     source=item.get("source", None),
                     delivery=delivery,
                     thumbnail=item.get("thumbnail", None),
@@ -98,5 +139,6 @@ async def fetch_shopping_results(message: str, intent: str) -> List[ShoppingResu
         return products
 
     except Exception as e:
-        logger.error("SerpAPI fetch failed: %s", str(e)[:150])
+        # Exception type only — httpx error messages can include the keyed URL
+        logger.error("SerpAPI fetch failed: %s", type(e).__name__)
         return []
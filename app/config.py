@@ -1,11 +1,34 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+import os
+import sys
+from functools import cached_property, lru_cache
 from typing import List
-from pydantic_settings import BaseSettings
+
+import orjson
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+__all__ = ["Settings", "settings", "get_settings"]
+
+_ENV_FILE = ".env"
+# Checked once per process; with no .env, pydantic-settings never touches
+# the filesystem for it.
+_HAS_ENV_FILE = os.path.isfile(_ENV_FILE)
+
+_DEFAULT_ALLOWED_ORIGINS = "http://127.0.0.1:8000,http://localhost:8000,http://localhost:5173,http://127.0.0.1:5173"
+_DEFAULT_CORS_ORIGINS = tuple(sys.intern(o) for o in _DEFAULT_ALLOWED_ORIGINS.split(","))
 
 
 class Settings(BaseSettings):
 
+    model_config = SettingsConfigDict(
+        env_file          = _ENV_FILE if _HAS_ENV_FILE else None,
+        env_file_encoding = "utf-8",
+        extra             = "ignore",
+        frozen            = True,
+        validate_default  = False,
+    )
+
     # ── Groq LLM ─────────────────────────────────────────────────────────────
     groq_api_key:       str  = ""
     groq_primary_model: str  = "llama-3.3-70b-versatile"
@@ -13,19 +36,36 @@ class Settings(BaseSettings):
     llm_enabled:        bool = True
     llm_max_concurrent: int  = 3
 
+    # ── Pipeline ──────────────────────────────────────────────────────────────
+    pipeline_timeout: float = 180.0   # seconds before /api/compare/sync gives up
+    # Coalesce per-site SSE events into site_done_batch frames (newer clients only)
+    sse_batch_site_events: bool = False
+
     # ── Browser ───────────────────────────────────────────────────────────────
-    playwright_headless: bool = True
+    playwright_headless:    bool = True
+    scraper_max_concurrent: int  = 3   # browser pages open at once across all sites
 
     # ── Marketplaces ─────────────────────────────────────────────────────────
     marketplaces_dir: str = "app/marketplaces/configs"
 
     # ── CORS ─────────────────────────────────────────────────────────────────
-    allowed_origins: str = "http://127.0.0.1:8000,http://localhost:8000,http://localhost:5173,http://127.0.0.1:5173"
+    allowed_origins: str = _DEFAULT_ALLOWED_ORIGINS
 
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
-        """Split comma-separated ALLOWED_ORIGINS into a list."""
-        return [o.strip() for o in self.allowed_origins.split(",") if o.strip()]
+        """Split comma-separated ALLOWED_ORIGINS into a list (parsed once)."""
+        allowed = self.allowed_origins
+        if allowed == _DEFAULT_ALLOWED_ORIGINS:
+            return list(_DEFAULT_CORS_ORIGINS)
+        allowed = allowed.strip()
+        if allowed.startswith("["):
+            # JSON array form: ALLOWED_ORIGINS=["https://a.com", "https://b.com"]
+            parts = (str(o).strip() for o in orjson.loads(allowed))
+        else:
+            parts = (o.strip() for o in allowed.split(","))
+        # Interned + order-preserving dedupe: a repeated origin in the env
+        # would otherwise be matched twice by CORSMiddleware.
+        return list(dict.fromkeys(sys.intern(p) for p in parts if p))
 
     # ── Redis (optional caching) ─────────────────────────────────────────────
     redis_url: str = ""       # e.g. redis://localhost:6379/0
@@ -52,10 +92,11 @@ class Settings(BaseSettings):
     watchlist_max_items_per_user:   int = 20
     price_history_retention_days:   int = 90
 
-    class Config:
-        env_file          = ".env"
-        env_file_encoding = "utf-8"
-        extra             = "ignore"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once per process (.env read + validation happen here only)."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -29,15 +29,11 @@ Constraint #7: Extractor runs ONLY after ALL scrapers complete
 """
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Tuple
+
 from langgraph.graph import StateGraph, START, END
 
-from app.state import CompareState
-from app.agents.planner import planner_node
-from app.agents.scraper import make_scraper_node
-from app.agents.extractor import extractor_node
-from app.agents.matcher import matcher_node, should_retry_or_continue
-from app.agents.ranker import ranker_node
-from app.agents.llm_ranker import explainer_node
 from app.marketplaces.registry import marketplace_registry
 from app.utils.logger import get_logger
 
@@ -50,44 +46,57 @@ def build_graph():
     Dynamically adds one scraper node per enabled marketplace.
     All scraper nodes run in parallel (LangGraph fan-out from planner).
     Extractor waits for ALL scrapers (LangGraph fan-in).
+
+    Compiles a new graph on every call; use get_graph() for the cached one.
     """
+    site_keys = tuple(cfg.key for cfg in marketplace_registry.all_enabled())
+    return _compile_graph(site_keys)
+
+
+def _compile_graph(site_keys: Tuple[str, ...]):
+    # Agent modules (Groq client, Playwright scrapers) are imported here, so
+    # `import app.graph` stays cheap for callers that never compile.
+    from app.state import CompareState
+    from app.agents.planner import planner_node
+    from app.agents.scraper import make_scraper_node
+    from app.agents.extractor import extractor_node
+    from app.agents.matcher import matcher_node, should_retry_or_continue
+    from app.agents.ranker import ranker_node
+    from app.agents.llm_ranker import explainer_node
+
     builder = StateGraph(CompareState)
+    add_node, add_edge = builder.add_node, builder.add_edge
 
     # ── Processing nodes ─────────────────────────────────────────────────
-    builder.add_node("planner",   planner_node)
-    builder.add_node("extractor", extractor_node)
-    builder.add_node("matcher",   matcher_node)
-    builder.add_node("ranker",    ranker_node)
-    builder.add_node("explainer", explainer_node)
+    add_node("planner",   planner_node)
+    add_node("extractor", extractor_node)
+    add_node("matcher",   matcher_node)
+    add_node("ranker",    ranker_node)
+    add_node("explainer", explainer_node)
 
     # ── Scraper nodes — one per enabled marketplace ──────────────────────
-    site_keys = [cfg.key for cfg in marketplace_registry.all_enabled()]
     logger.info(
         "Graph: building with %d scraper nodes: %s",
-        len(site_keys), site_keys,
+        len(site_keys), list(site_keys),
     )
 
-    for site_key in site_keys:
-        builder.add_node(site_key, make_scraper_node(site_key))
-
     # ── Edges ────────────────────────────────────────────────────────────
     # START → planner
-    builder.add_edge(START, "planner")
+    add_edge(START, "planner")
 
     if site_keys:
-        # planner → [all scrapers] (parallel fan-out)
-        for site_key in site_keys:
-            builder.add_edge("planner", site_key)
-
-        # [all scrapers] → extractor (fan-in: waits for ALL)
+        # One pass per site: node, planner → site (parallel fan-out),
+        # site → extractor (fan-in: waits for ALL)
         for site_key in site_keys:
-            builder.add_edge(site_key, "extractor")
+            add_node(site_key, make_scraper_node(site_key))
+            add_edge("planner", site_key)
+            add_edge(site_key, "extractor")
     else:
         # No sites enabled — direct path (fallback)
-        builder.add_edge("planner", "extractor")
+        add_edge("planner", "extractor")
 
     # extractor → matcher
-    builder.add_edge("extractor", "matcher")
+    add_edge("extractor", "matcher")
 
     # matcher → conditional edge
     builder.add_conditional_edges(
@@ -101,10 +110,10 @@ def build_graph():
     )
 
     # ranker → explainer
-    builder.add_edge("ranker", "explainer")
+    add_edge("ranker", "explainer")
 
     # explainer → END
-    builder.add_edge("explainer", END)
+    add_edge("explainer", END)
 
     compiled = builder.compile()
     logger.info("Graph: compiled successfully (%d scraper nodes)", len(site_keys))
@@ -112,6 +121,13 @@ def build_graph():
 
 
 # ── Singleton compiled graph ─────────────────────────────────────────────────
-# Built once at import time. Restart server to pick up marketplace config changes.
-
-graph = build_graph()
+# Built on first use (or eagerly from the FastAPI lifespan), then reused.
+# Restart server to pick up marketplace config changes.
+# Not persisted across restarts: CompiledStateGraph holds closures LangGraph
+# creates in attach_node(), so it can't be pickled — and build + compile is
+# ~20 ms, small next to importing the agents.
+
+@lru_cache(maxsize=1)
+def get_graph():
+    """Return the process-wide compiled graph, compiling it on first call."""
+    return build_graph()
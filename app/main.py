@@ -10,16 +10,20 @@ Endpoints:
   GET  /health            → Health check
   GET  /api/marketplaces  → List all marketplaces
 """
-import json
+import hashlib
+import re
 import time
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 
 import asyncio
+import orjson
+from cachetools import TTLCache
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -30,8 +34,12 @@ from app.schemas import (
     NormalizedOffer, SiteStatus, RankingMode,
 )
 from app.chatbot.schemas import ChatRequest as ChatRequest
+from app.graph import get_graph
 from app.marketplaces.registry import marketplace_registry
-from app.utils.llm_client import llm_client
+from app.utils.llm_client import llm_client, close_http_client as close_groq_http_client
+from app.chatbot.search import close_http_client as close_search_http_client
+from app.utils.executors import shutdown_pools
+from app.scraping.browser import close_browser
 from app.utils.logger import get_logger
 
 # ── Watchlist feature imports ─────────────────────────────────────────────────
@@ -47,65 +55,202 @@ from app.watchlist.service import (
 from app.watchlist.price_monitor import check_price_for_item
 from app.watchlist.scheduler import start_scheduler, stop_scheduler
 from app.watchlist.models import init_db, get_db, async_session as wl_async_session
-from app.watchlist.email_sender import send_welcome_email, send_watchlist_added_email
+from app.watchlist.email_sender import (
+    generate_ai_message, send_welcome_email, send_watchlist_added_email,
+)
 
 logger = get_logger(__name__)
 
 
+# ── JSON serializer helper ───────────────────────────────────────────────────
+
+def _serialize(obj):
+    """JSON-safe serialization for Pydantic models and other objects."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    return str(obj)
+
+
+# Built once; datetimes (native in orjson) are emitted as UTC with a Z suffix.
+_ORJSON_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+
+def _dumps(obj) -> bytes:
+    """orjson encode for SSE frames and cache values.
+
+    orjson only calls `default` for types it can't encode natively, so the
+    model_dump() payloads on the hot path never reach _serialize.
+    """
+    return orjson.dumps(obj, default=_serialize, option=_ORJSON_OPTS)
+
+
+def _frame(event: bytes, data: bytes) -> bytes:
+    """One SSE event as bytes. orjson output has no newlines, so a single
+    data: line is enough; LF separators match the frontend's "\n\n" split."""
+    return b"event: " + event + b"\ndata: " + data + b"\n\n"
+
+
+class _OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson, for routes without a response_model.
+
+    Routes that declare response_model keep FastAPI's default class: it
+    dumps the model straight to bytes in pydantic-core, which an explicit
+    response_class would switch off.
+    """
+
+    def render(self, content) -> bytes:
+        return _dumps(content)
+
+
+def _elapsed_s(start_ns: int) -> float:
+    """Seconds since a perf_counter_ns() mark, truncated to milliseconds."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000 / 1000
+
+
 # ── Optional: Redis caching ──────────────────────────────────────────────────
 
 _redis_client = None
+_redis_retry_at = 0.0          # monotonic time before which we don't reconnect
+_REDIS_COOLDOWN_S = 30.0
 
 try:
     import redis.asyncio as aioredis
+    from redis.asyncio.retry import Retry
+    from redis.backoff import ExponentialBackoff
     _REDIS_AVAILABLE = True
 except ImportError:
     _REDIS_AVAILABLE = False
 
 
 async def _get_redis():
-    """Get async Redis client (lazy init). Returns None if unavailable."""
-    global _redis_client
+    """Get async Redis client (lazy init). Returns None if unavailable.
+
+    Uses a bounded, health-checked connection pool. If Redis is down, the
+    failed connect is remembered for _REDIS_COOLDOWN_S so requests don't
+    each pay for a reconnect attempt.
+    """
+    global _redis_client, _redis_retry_at
     if not _REDIS_AVAILABLE:
         return None
     url = getattr(settings, "redis_url", None) or ""
     if not url.strip():
         return None
     if _redis_client is None:
+        if time.monotonic() < _redis_retry_at:
+            return None
         try:
-            _redis_client = aioredis.from_url(url, decode_responses=True)
-            await _redis_client.ping()
+            pool = aioredis.BlockingConnectionPool.from_url(
+                url,
+                max_connections=32,
+                timeout=1.0,
+                socket_keepalive=True,
+                socket_timeout=0.25,
+                socket_connect_timeout=0.5,
+                health_check_interval=30,
+            )
+            client = aioredis.Redis(
+                connection_pool=pool,
+                retry=Retry(ExponentialBackoff(), 2),
+            )
+            await client.ping()
+            _redis_client = client
             logger.info("Redis connected: %s", url[:40])
         except Exception as e:
             logger.warning("Redis unavailable: %s", str(e)[:80])
+            _redis_retry_at = time.monotonic() + _REDIS_COOLDOWN_S
             _redis_client = None
     return _redis_client
 
 
+_WS_RE = re.compile(r"\s+")
+# Punctuation that doesn't change a product search ("iPhone 15!" == "iphone 15");
+# + . - / are kept since they carry meaning in model names and sizes.
+_PUNCT_RE = re.compile(r"[^\w\s+.\-/]")
+
+
+def _ckey(prefix: str, text: str, mode: str = "") -> str:
+    """Fixed-size cache key from a normalized query/message.
+
+    Free text is lower-cased, stripped of filler punctuation and
+    whitespace-collapsed so trivial variants share an entry; URLs are only
+    lower-cased/stripped so distinct product links never collide.
+    """
+    norm = text.strip().lower()
+    if not norm.startswith(("http://", "https://")):
+        norm = _WS_RE.sub(" ", _PUNCT_RE.sub(" ", norm)).strip()
+    digest = hashlib.blake2b(norm.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{prefix}:{mode}:{digest}" if mode else f"{prefix}:{digest}"
+
+
+# Per-worker L1 in front of Redis: repeats of a hot query within a minute are
+# a dict lookup. Values are written only by _set_cache() (or on a Redis hit).
+_LOCAL_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+
 async def _get_cache(query: str, mode: str) -> Optional[dict]:
-    """Check Redis cache. Key = f"{query}:{mode}", TTL = 5 min."""
+    """Check L1 then Redis. Key = _ckey("compare", query, mode), TTL = 5 min."""
+    key = _ckey("compare", query, mode)
+    cached = _LOCAL_CACHE.get(key)
+    if cached is not None:
+        return cached
     r = await _get_redis()
     if not r:
         return None
     try:
-        key = f"compare:{query}:{mode}"
         cached = await r.get(key)
         if cached:
             logger.info("Cache HIT: %s", key[:60])
-            return json.loads(cached)
+            data = orjson.loads(cached)
+            _LOCAL_CACHE[key] = data
+            return data
     except Exception as e:
         logger.warning("Cache get error: %s", str(e)[:60])
     return None
 
 
-async def _set_cache(query: str, mode: str, data: dict):
-    """Store in Redis with 5 min TTL."""
+async def _get_sse_cache(query: str, mode: str) -> Optional[bytes]:
+    """Return the cached, fully framed final_result SSE event, if any."""
+    key = _ckey("sse", query, mode)
+    frame = _LOCAL_CACHE.get(key)
+    if frame is not None:
+        return frame
+    r = await _get_redis()
+    if not r:
+        return None
+    try:
+        frame = await r.get(key)
+        if frame:
+            logger.info("Cache HIT: %s", key[:60])
+            _LOCAL_CACHE[key] = frame
+            return frame
+    except Exception as e:
+        logger.warning("Cache get error: %s", str(e)[:60])
+    return None
+
+
+async def _set_cache(query: str, mode: str, data: dict, payload: Optional[bytes] = None):
+    """Store in Redis with 5 min TTL (JSON payload + pre-framed SSE event).
+
+    Pass `payload` when `data` has already been encoded with _dumps().
+    """
+    key, sse_key = _ckey("compare", query, mode), _ckey("sse", query, mode)
+    if payload is None:
+        payload = _dumps(data)
+    frame = _frame(b"final_result", payload)
+    _LOCAL_CACHE[key] = data
+    _LOCAL_CACHE[sse_key] = frame
+
     r = await _get_redis()
     if not r:
         return
     try:
-        key = f"compare:{query}:{mode}"
-        await r.set(key, json.dumps(data, default=str), ex=300)
+        # Both keys in one round-trip (non-transactional pipeline)
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(key, payload, ex=300)
+            pipe.set(sse_key, frame, ex=300)
+            await pipe.execute()
         logger.info("Cache SET: %s (TTL=300s)", key[:60])
     except Exception as e:
         logger.warning("Cache set error: %s", str(e)[:60])
@@ -133,8 +278,10 @@ async def _init_pg():
     try:
         _pg_pool = await asyncpg.create_pool(url, min_size=1, max_size=5)
         async with _pg_pool.acquire() as conn:
+            # UNLOGGED: append-only log data skips WAL for faster inserts.
+            # Trade-off — the table is truncated after a Postgres crash.
             await conn.execute("""
-                CREATE TABLE IF NOT EXISTS price_history (
+                CREATE UNLOGGED TABLE IF NOT EXISTS price_history (
                     id SERIAL PRIMARY KEY,
                     query TEXT NOT NULL,
                     mode TEXT NOT NULL,
@@ -144,7 +291,11 @@ async def _init_pg():
                     rating DOUBLE PRECISION,
                     url TEXT,
                     created_at TIMESTAMP DEFAULT NOW()
-                )
+                );
+                CREATE INDEX IF NOT EXISTS price_history_created_brin
+                    ON price_history USING brin (created_at);
+                CREATE INDEX IF NOT EXISTS price_history_query_idx
+                    ON price_history (query, created_at DESC);
             """)
         logger.info("PostgreSQL connected and price_history table ready")
     except Exception as e:
@@ -152,28 +303,197 @@ async def _init_pg():
         _pg_pool = None
 
 
-async def _log_prices(query: str, mode: str, offers: list):
-    """Store price entries in PostgreSQL price_history table."""
-    if not _pg_pool:
+_PRICE_HISTORY_COLUMNS = ["query", "mode", "site", "title", "price", "rating", "url"]
+_PRICE_HISTORY_INSERT = (
+    "INSERT INTO price_history (query, mode, site, title, price, rating, url) "
+    "VALUES ($1, $2, $3, $4, $5, $6, $7)"
+)
+
+# Rows from every request funnel through one queue into a single writer task,
+# which flushes them in batches. _log_prices() itself never touches the pool.
+_price_queue: Optional[asyncio.Queue] = None
+_price_writer_task: Optional[asyncio.Task] = None
+_PRICE_BATCH_MAX_ROWS = 500
+_PRICE_BATCH_MAX_WAIT = 0.2   # seconds to keep filling a batch after the first row
+
+
+def _price_row(query: str, mode: str, o) -> tuple:
+    """One price_history record, in _PRICE_HISTORY_COLUMNS order."""
+    d = o if isinstance(o, dict) else o.model_dump()
+    return (
+        query, mode,
+        d.get("platform_key") or d.get("site", ""),
+        d.get("title", ""),
+        d.get("effective_price"),
+        d.get("seller_rating") or d.get("rating"),
+        d.get("listing_url") or d.get("url", ""),
+    )
+
+
+def _log_prices(query: str, mode: str, offers: list):
+    """Queue price entries for the PostgreSQL price_history table.
+
+    `offers` are normally the already-dumped offer dicts that get cached;
+    models are dumped on the way in.
+    """
+    if _price_queue is None:
         return
+    put = _price_queue.put_nowait
+    try:
+        for o in offers[:10]:
+            put(_price_row(query, mode, o))
+    except asyncio.QueueFull:
+        logger.warning("Price log queue full — dropping rows for '%s'", query[:40])
+
+
+async def _drain_price_queue() -> Tuple[list, bool]:
+    """Wait for one row, then batch whatever arrives within the wait window.
+
+    Returns (rows, stop) — stop is True once the shutdown sentinel is seen.
+    """
+    first = await _price_queue.get()
+    if first is None:
+        return [], True
+    rows = [first]
+    deadline = time.monotonic() + _PRICE_BATCH_MAX_WAIT
+    while len(rows) < _PRICE_BATCH_MAX_ROWS:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            break
+        try:
+            row = await asyncio.wait_for(_price_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        if row is None:
+            return rows, True
+        rows.append(row)
+    return rows, False
+
+
+async def _write_price_rows(rows: list):
     try:
         async with _pg_pool.acquire() as conn:
-            for o in offers[:10]:
-                await conn.execute(
-                    "INSERT INTO price_history (query, mode, site, title, price, rating, url) "
-                    "VALUES ($1, $2, $3, $4, $5, $6, $7)",
-                    query, mode,
-                    getattr(o, "platform_key", "") or getattr(o, "site", ""),
-                    getattr(o, "title", ""),
-                    getattr(o, "effective_price", None),
-                    getattr(o, "seller_rating", None) or getattr(o, "rating", None),
-                    getattr(o, "listing_url", "") or getattr(o, "url", ""),
+            try:
+                await conn.copy_records_to_table(
+                    "price_history", records=rows, columns=_PRICE_HISTORY_COLUMNS,
                 )
-        logger.info("Logged %d prices to PostgreSQL", min(len(offers), 10))
+            except asyncpg.PostgresError as e:
+                # COPY can be refused (e.g. restricted roles) — plain inserts still work
+                logger.warning("COPY failed (%s) — falling back to prepared INSERT", str(e)[:60])
+                stmt = await conn.prepare(_PRICE_HISTORY_INSERT)
+                await stmt.executemany(rows)
+        logger.info("Logged %d prices to PostgreSQL", len(rows))
     except Exception as e:
         logger.warning("PostgreSQL log error: %s", str(e)[:80])
 
 
+async def _price_writer():
+    """Background consumer: batch queued rows into price_history until shutdown."""
+    stop = False
+    while not stop:
+        rows, stop = await _drain_price_queue()
+        if rows:
+            await _write_price_rows(rows)
+
+
+def _start_price_writer():
+    global _price_queue, _price_writer_task
+    if not _pg_pool:
+        return
+    _price_queue = asyncio.Queue(maxsize=10_000)
+    _price_writer_task = asyncio.create_task(_price_writer())
+
+
+async def _stop_price_writer():
+    global _price_queue, _price_writer_task
+    if _price_writer_task is None:
+        return
+    await _price_queue.put(None)
+    await _price_writer_task
+    _price_queue = _price_writer_task = None
+
+
+# ── Background persistence ───────────────────────────────────────────────────
+# Cache writes run as tasks so responses don't wait on Redis (price rows go
+# through the writer queue above). Strong refs keep pending tasks alive.
+
+_background_tasks: set = set()
+_PERSIST_SEMAPHORE = None
+
+
+def _get_persist_semaphore() -> asyncio.Semaphore:
+    global _PERSIST_SEMAPHORE
+    if _PERSIST_SEMAPHORE is None:
+        # Caps in-flight writes so a burst can't exhaust the Redis/PG pools
+        _PERSIST_SEMAPHORE = asyncio.Semaphore(50)
+    return _PERSIST_SEMAPHORE
+
+
+async def _bounded(coro):
+    async with _get_persist_semaphore():
+        await coro
+
+
+def _fire_and_forget(coro) -> None:
+    """Schedule a persistence or notification coroutine without awaiting it."""
+    task = asyncio.create_task(_bounded(coro))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+# ── Single-flight ────────────────────────────────────────────────────────────
+# Identical (query, mode) requests that arrive while a pipeline is already
+# running wait for its result instead of starting their own scrape + LLM run.
+# Check-and-insert has no await in between, so no lock is needed.
+
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+def _join_inflight(key: str) -> Tuple[asyncio.Future, bool]:
+    """Return (future, is_leader); the leader must call _finish_inflight()."""
+    fut = _INFLIGHT.get(key)
+    if fut is not None:
+        return fut, False
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    return fut, True
+
+
+def _finish_inflight(key: str, fut: asyncio.Future, data: Optional[dict]) -> None:
+    """Publish the leader's cache-shaped result (None = failed) to followers."""
+    if _INFLIGHT.get(key) is fut:
+        del _INFLIGHT[key]
+    if not fut.done():
+        fut.set_result(data)
+
+
+def _fail_inflight(key: str, fut: asyncio.Future, exc: BaseException) -> None:
+    """Publish the leader's error so followers raise the same one."""
+    if _INFLIGHT.get(key) is fut:
+        del _INFLIGHT[key]
+    if not fut.done():
+        if not isinstance(exc, Exception):
+            # Leader was cancelled — followers shouldn't be cancelled with it
+            exc = HTTPException(status_code=503, detail="Pipeline cancelled")
+        fut.set_exception(exc)
+        fut.exception()   # mark retrieved: there may be no followers
+
+
+async def _await_inflight(fut: asyncio.Future) -> Optional[dict]:
+    # shield: a follower disconnecting must not cancel the shared future
+    return await asyncio.shield(fut)
+
+
+# Streamed pipelines run detached from any one connection; shutdown cancels them
+_pipeline_tasks: set = set()
+
+
+def _spawn_pipeline(coro) -> None:
+    task = asyncio.create_task(coro)
+    _pipeline_tasks.add(task)
+    task.add_done_callback(_pipeline_tasks.discard)
+
+
 # ── Lifespan ──────────────────────────────────────────────────────────────────
 
 
@@ -200,16 +520,18 @@ async def lifespan(app: FastAPI):
         "Marketplaces: %d enabled — %s",
         len(enabled), [m.key for m in enabled],
     )
+    app.state.scraper_health_cache = (enabled, _build_scraper_health(enabled))
 
-    # Lazy-import graph to trigger compilation
+    # Warm the graph cache so the first request doesn't pay for compilation
     try:
-        from app.graph import graph  # noqa: F401
+        graph = get_graph()
         logger.info("LangGraph compiled ✓ (%d nodes)", len(graph.nodes))
     except Exception as e:
         logger.error("LangGraph compilation failed: %s", e)
 
     # Optional: init PostgreSQL (legacy price_history)
     await _init_pg()
+    _start_price_writer()
 
     # Watchlist: init DB tables + start scheduler
     try:
@@ -227,11 +549,24 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
-    # Cleanup
+    # Cleanup — stop unfinished pipelines, then let pending cache/log writes
+    # finish before closing pools
+    for task in list(_pipeline_tasks):
+        task.cancel()
+    if _pipeline_tasks:
+        await asyncio.gather(*_pipeline_tasks, return_exceptions=True)
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
     if _redis_client:
         await _redis_client.close()
+        await _redis_client.connection_pool.disconnect()
+    await _stop_price_writer()
     if _pg_pool:
         await _pg_pool.close()
+    await close_search_http_client()
+    await close_groq_http_client()
+    await close_browser()
+    shutdown_pools()
     logger.info("=== Shutdown ===")
 
 
@@ -245,30 +580,69 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Concrete method/header lists let Starlette answer preflights from the sets it
+# builds at startup instead of echoing each request's Access-Control-Request-*;
+# origins are frozen for O(1) membership checks.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=frozenset(settings.cors_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 
-# ── JSON serializer helper ───────────────────────────────────────────────────
-
-def _serialize(obj):
-    """JSON-safe serialization for Pydantic models and other objects."""
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
-    if hasattr(obj, "dict"):
-        return obj.dict()
-    return str(obj)
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # SSE Streaming endpoint (master prompt spec)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# EventSourceResponse sets Cache-Control / Connection itself; this stops Nginx
+# from buffering the stream so events reach the browser as they're produced.
+_SSE_HEADERS = {"X-Accel-Buffering": "no"}
+
+# The frontend splits frames on "\n\n", so keep-alive pings use LF
+# separators too (the library default is CRLF).
+_SSE_SEP = "\n"
+
+
+# site_done_batch: site statuses that finish within this window share one frame
+_SITE_BATCH_WINDOW = 0.05
+_STREAM_END = object()
+
+
+async def _with_idle_ticks(agen, idle: float):
+    """Re-yield `agen`'s items, plus None whenever nothing arrives for `idle` s.
+
+    The source is drained by one pump task, so LangGraph's generator always
+    runs in a single task; waiting on the queue with a timeout is cancel-safe.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async for item in agen:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(_STREAM_END)
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), idle)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+
 
 @app.post("/api/compare")
 async def compare_stream(request: CompareRequest):
@@ -277,6 +651,8 @@ async def compare_stream(request: CompareRequest):
     SSE events emitted:
       scraping_started → all scrapers fired
       site_done        → per site completion + SiteStatus
+      site_done_batch  → {"sites": [SiteStatus, ...]} instead of site_done
+                         when SSE_BATCH_SITE_EVENTS is on
       matching_done    → Matcher completed + count
       ranking_done     → Ranker completed
       final_result     → complete final_response JSON
@@ -287,109 +663,157 @@ async def compare_stream(request: CompareRequest):
     query = request.query or request.product_url or ""
     mode = request.mode or (request.preferences.mode if request.preferences else "balanced")
 
-    # Check Redis cache first
-    cached = await _get_cache(query, mode)
-    if cached:
+    # Check Redis cache first — a hit is streamed as stored, no JSON work
+    frame = await _get_sse_cache(query, mode)
+    if frame:
         async def cached_gen():
-            yield f"event: final_result\ndata: {json.dumps(cached, default=_serialize)}\n\n"
-        return StreamingResponse(
-            cached_gen(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-        )
+            yield frame
+        return EventSourceResponse(cached_gen(), headers=_SSE_HEADERS, sep=_SSE_SEP)
 
     async def event_generator():
-        from app.graph import graph
+        flight_key = _ckey("compare", query, mode)
+        fut, leader = _join_inflight(flight_key)
+        if not leader:
+            try:
+                data = await _await_inflight(fut)
+            except Exception as e:
+                # A /api/compare/sync leader failed — relay its error
+                detail = e.detail if isinstance(e, HTTPException) else str(e)
+                yield _frame(b"error", _dumps({"error": str(detail)[:200]}))
+                return
+            if data is None:
+                yield _frame(b"error", _dumps({"error": "Pipeline failed"}))
+            else:
+                # Leader's result is already plain JSON types — no default= hook
+                yield _frame(b"final_result", orjson.dumps(data, option=_ORJSON_OPTS))
+            return
+
+        # The pipeline runs in its own task; this connection only reads frames
+        frames: asyncio.Queue = asyncio.Queue()
+        _spawn_pipeline(_run_compare_stream(query, mode, flight_key, fut, frames))
+        while True:
+            frame = await frames.get()
+            if frame is _STREAM_END:
+                return
+            yield frame
+
+    return EventSourceResponse(
+        event_generator(), ping=15, headers=_SSE_HEADERS, sep=_SSE_SEP,
+    )
 
-        initial_state = {
-            "query": query,
-            "mode": mode,
-            "match_attempts": 0,
-            "raw_results": [],
-            "site_statuses": [],
-        }
 
-        start_time = time.time()
-        final_state = {}
-        scrapers_announced = False
+async def _run_compare_stream(
+    query: str, mode: str, flight_key: str, fut: asyncio.Future, frames: asyncio.Queue,
+) -> None:
+    """Run one streamed pipeline, pushing SSE frames to `frames`.
 
-        try:
-            async for chunk in graph.astream(initial_state, stream_mode="updates"):
-                for node_name, update in chunk.items():
-                    final_state.update(update)
-
-                    if node_name == "planner":
-                        target_sites = update.get("target_sites", [])
-                        yield (
-                            f"event: scraping_started\n"
-                            f"data: {json.dumps({'sites': target_sites})}\n\n"
-                        )
-                        scrapers_announced = True
-
-                    elif node_name in [cfg.key for cfg in marketplace_registry.all_enabled()]:
-                        # Per-site completion
-                        statuses = update.get("site_statuses", [])
-                        for s in statuses:
-                            sd = s.model_dump() if hasattr(s, "model_dump") else _serialize(s)
-                            yield (
-                                f"event: site_done\n"
-                                f"data: {json.dumps(sd, default=str)}\n\n"
-                            )
-
-                    elif node_name == "matcher":
-                        matched = update.get("matched_results", [])
-                        yield (
-                            f"event: matching_done\n"
-                            f"data: {json.dumps({'matched_count': len(matched)})}\n\n"
-                        )
-
-                    elif node_name == "ranker":
-                        ranked = update.get("ranked_results", [])
-                        yield (
-                            f"event: ranking_done\n"
-                            f"data: {json.dumps({'ranked_count': len(ranked)})}\n\n"
-                        )
-
-                    elif node_name == "explainer":
-                        fr = update.get("final_response", {})
-                        # Serialize Pydantic models in final_response
-                        serialized = {}
-                        for k, v in fr.items():
-                            if isinstance(v, list):
-                                serialized[k] = [
-                                    o.model_dump() if hasattr(o, "model_dump") else o
-                                    for o in v
-                                ]
-                            elif hasattr(v, "model_dump"):
-                                serialized[k] = v.model_dump()
-                            else:
-                                serialized[k] = v
-
-                        serialized["query_time_seconds"] = round(time.time() - start_time, 3)
-
-                        yield (
-                            f"event: final_result\n"
-                            f"data: {json.dumps(serialized, default=str)}\n\n"
-                        )
-
-                        # Cache + log
-                        await _set_cache(query, mode, serialized)
-                        ranked_offers = fr.get("ranked_offers", [])
-                        if ranked_offers:
-                            await _log_prices(query, mode, ranked_offers)
+    Detached from the leader's connection: a disconnect only stops the frames
+    being read, so followers and the cache still get the result.
+    """
+    graph = get_graph()
+
+    initial_state = {
+        "query": query,
+        "mode": mode,
+        "match_attempts": 0,
+        "raw_results": [],
+        "site_statuses": [],
+    }
 
-        except Exception as e:
-            logger.exception("SSE pipeline error: %s", e)
-            yield (
-                f"event: error\n"
-                f"data: {json.dumps({'error': str(e)[:200]})}\n\n"
-            )
+    start_ns = time.perf_counter_ns()
+    final_state = {}
+    marketplace_keys = marketplace_registry.enabled_keys()
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    updates = graph.astream(initial_state, stream_mode="updates")
+    batch_sites = settings.sse_batch_site_events
+    if batch_sites:
+        updates = _with_idle_ticks(updates, _SITE_BATCH_WINDOW)
+    site_buf: list = []
+    flush_at = 0.0
+    emit = frames.put_nowait
+
+    try:
+        async for chunk in updates:
+            if site_buf and (
+                chunk is None
+                or len(site_buf) >= len(marketplace_keys)
+                or time.monotonic() >= flush_at
+            ):
+                emit(_frame(b"site_done_batch", _dumps({"sites": site_buf})))
+                site_buf = []
+            if chunk is None:
+                continue
+
+            for node_name, update in chunk.items():
+                final_state.update(update)
+
+                if site_buf and node_name not in marketplace_keys:
+                    # Keep event order: pending site updates go out first
+                    emit(_frame(b"site_done_batch", _dumps({"sites": site_buf})))
+                    site_buf = []
+
+                if node_name == "planner":
+                    target_sites = update.get("target_sites", [])
+                    emit(_frame(b"scraping_started", _dumps({"sites": target_sites})))
+
+                elif node_name in marketplace_keys:
+                    # Per-site completion
+                    statuses = update.get("site_statuses", [])
+                    for s in statuses:
+                        sd = s.model_dump() if hasattr(s, "model_dump") else _serialize(s)
+                        if not batch_sites:
+                            emit(_frame(b"site_done", _dumps(sd)))
+                            continue
+                        if not site_buf:
+                            flush_at = time.monotonic() + _SITE_BATCH_WINDOW
+                        site_buf.append(sd)
+
+                elif node_name == "matcher":
+                    matched = update.get("matched_results", [])
+                    emit(_frame(b"matching_done", _dumps({"matched_count": len(matched)})))
+
+                elif node_name == "ranker":
+                    ranked = update.get("ranked_results", [])
+                    emit(_frame(b"ranking_done", _dumps({"ranked_count": len(ranked)})))
+
+                elif node_name == "explainer":
+                    fr = update.get("final_response", {})
+                    # Serialize Pydantic models in final_response
+                    serialized = {}
+                    for k, v in fr.items():
+                        if isinstance(v, list):
+                            serialized[k] = [
+                                o.model_dump() if hasattr(o, "model_dump") else o
+                                for o in v
+                            ]
+                        elif hasattr(v, "model_dump"):
+                            serialized[k] = v.model_dump()
+                        else:
+                            serialized[k] = v
+
+                    serialized["query_time_seconds"] = _elapsed_s(start_ns)
+                    _finish_inflight(flight_key, fut, serialized)
+
+                    payload = _dumps(serialized)
+                    emit(_frame(b"final_result", payload))
+
+                    # Cache + log (off the response path)
+                    _fire_and_forget(_set_cache(query, mode, serialized, payload))
+                    ranked_offers = serialized.get("ranked_offers")
+                    if ranked_offers:
+                        _log_prices(query, mode, ranked_offers)
+
+        if site_buf:
+            emit(_frame(b"site_done_batch", _dumps({"sites": site_buf})))
+
+    except Exception as e:
+        logger.exception("SSE pipeline error: %s", e)
+        emit(_frame(b"error", _dumps({"error": str(e)[:200]})))
+    finally:
+        # No-op once a result is out; otherwise the pipeline failed or was
+        # cancelled at shutdown, and followers get None
+        _finish_inflight(flight_key, fut, None)
+        emit(_STREAM_END)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -397,6 +821,17 @@ async def compare_stream(request: CompareRequest):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+def _build_cache_data(ranked, site_statuses, explanation, best_deal, elapsed) -> dict:
+    """Plain-dict snapshot of a pipeline result for the cache and price log."""
+    return {
+        "ranked_offers": [o.model_dump() if hasattr(o, "model_dump") else o for o in ranked],
+        "site_statuses": [s.model_dump() if hasattr(s, "model_dump") else s for s in site_statuses],
+        "explanation": explanation,
+        "best_deal": best_deal.model_dump() if hasattr(best_deal, "model_dump") else best_deal,
+        "query_time_seconds": elapsed,
+    }
+
+
 @app.post("/api/compare/sync", response_model=CompareResponse)
 async def compare_sync(request: CompareRequest):
     """POST /api/compare/sync → Full JSON response (backward-compatible)."""
@@ -409,19 +844,43 @@ async def compare_sync(request: CompareRequest):
     # Check Redis cache
     cached = await _get_cache(query, mode)
     if cached:
-        return CompareResponse(
-            query_time_seconds=0.0,
-            final_offers=cached.get("ranked_offers", []),
-            offers=cached.get("ranked_offers", []),
-            site_statuses=cached.get("site_statuses", []),
-            explanation=cached.get("explanation", ""),
-            recommendation=cached.get("best_deal"),
-        )
+        return _response_from_cache(cached)
+
+    # Same request already running — share its result
+    flight_key = _ckey("compare", query, mode)
+    fut, leader = _join_inflight(flight_key)
+    if not leader:
+        # Raises the leader's HTTPException (504 on timeout, 500 on error)
+        shared = await _await_inflight(fut)
+        if shared is None:
+            raise HTTPException(status_code=500, detail="Pipeline error")
+        return _response_from_cache(shared)
+
+    try:
+        return await _run_compare_sync(query, mode, flight_key, fut)
+    except BaseException as exc:
+        _fail_inflight(flight_key, fut, exc)
+        raise
 
-    start = time.time()
+
+def _response_from_cache(cached: dict) -> CompareResponse:
+    return CompareResponse(
+        query_time_seconds=0.0,
+        final_offers=cached.get("ranked_offers", []),
+        offers=cached.get("ranked_offers", []),
+        site_statuses=cached.get("site_statuses", []),
+        explanation=cached.get("explanation", ""),
+        recommendation=cached.get("best_deal"),
+    )
+
+
+async def _run_compare_sync(
+    query: str, mode: str, flight_key: str, fut: asyncio.Future,
+) -> CompareResponse:
+    start_ns = time.perf_counter_ns()
 
     try:
-        from app.graph import graph
+        graph = get_graph()
 
         initial_state = {
             "query": query,
@@ -431,8 +890,13 @@ async def compare_sync(request: CompareRequest):
             "site_statuses": [],
         }
 
-        result = await graph.ainvoke(initial_state)
+        result = await asyncio.wait_for(
+            graph.ainvoke(initial_state), timeout=settings.pipeline_timeout,
+        )
 
+    except asyncio.TimeoutError as exc:
+        logger.error("Pipeline timed out after %.0fs: '%s'", settings.pipeline_timeout, query[:60])
+        raise HTTPException(status_code=504, detail="Pipeline timed out") from exc
     except Exception as exc:
         logger.exception("Pipeline error: %s", exc)
         raise HTTPException(status_code=500, detail=f"Pipeline error: {exc}") from exc
@@ -443,18 +907,15 @@ async def compare_sync(request: CompareRequest):
     explanation = final_response.get("explanation", "")
     best_deal = final_response.get("best_deal")
 
-    # Cache + log
-    elapsed = round(time.time() - start, 3)
-    cache_data = {
-        "ranked_offers": [o.model_dump() if hasattr(o, "model_dump") else o for o in ranked],
-        "site_statuses": [s.model_dump() if hasattr(s, "model_dump") else s for s in site_statuses],
-        "explanation": explanation,
-        "best_deal": best_deal.model_dump() if hasattr(best_deal, "model_dump") else best_deal,
-        "query_time_seconds": elapsed,
-    }
-    await _set_cache(query, mode, cache_data)
+    # Cache + log — model_dump of every offer runs in a worker thread
+    elapsed = _elapsed_s(start_ns)
+    cache_data = await asyncio.to_thread(
+        _build_cache_data, ranked, site_statuses, explanation, best_deal, elapsed,
+    )
+    _finish_inflight(flight_key, fut, cache_data)
+    _fire_and_forget(_set_cache(query, mode, cache_data))
     if ranked:
-        await _log_prices(query, mode, ranked)
+        _log_prices(query, mode, cache_data["ranked_offers"])
 
     return CompareResponse(
         query_time_seconds=elapsed,
@@ -481,7 +942,7 @@ async def compare_sync(request: CompareRequest):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@app.post("/api/debug/compare")
+@app.post("/api/debug/compare", response_class=_OrjsonResponse)
 async def debug_compare(request: CompareRequest):
     """Extended debug endpoint — returns all intermediate data."""
     if not request.query and not request.product_url:
@@ -489,10 +950,10 @@ async def debug_compare(request: CompareRequest):
 
     query = request.query or request.product_url or ""
     mode = request.mode or "balanced"
-    start = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
-        from app.graph import graph
+        graph = get_graph()
 
         initial_state = {
             "query": query,
@@ -506,15 +967,13 @@ async def debug_compare(request: CompareRequest):
 
     except Exception as exc:
         logger.exception("Debug pipeline error: %s", exc)
-        return {
-            "error": str(exc),
-            "query_time_seconds": round(time.time() - start, 3),
-        }
+        return {"error": str(exc), "query_time_seconds": _elapsed_s(start_ns)}
 
+    elapsed = _elapsed_s(start_ns)
     final_response = result.get("final_response", {})
 
-    return {
-        "query_time_seconds": round(time.time() - start, 3),
+    head = {
+        "query_time_seconds": elapsed,
         "normalized_product": result.get("normalized_product"),
         "target_sites": result.get("target_sites", []),
         "match_attempts": result.get("match_attempts", 0),
@@ -524,12 +983,36 @@ async def debug_compare(request: CompareRequest):
             "matched_results": len(result.get("matched_results", [])),
             "ranked_results": len(final_response.get("ranked_offers", [])),
         },
-        "raw_results": result.get("raw_results", []),
-        "cleaned_results": result.get("cleaned_results", []),
-        "matched_results": result.get("matched_results", []),
+    }
+    lists = (
+        ("raw_results", result.get("raw_results", [])),
+        ("cleaned_results", result.get("cleaned_results", [])),
+        ("matched_results", result.get("matched_results", [])),
+    )
+    tail = {
         "final_response": final_response,
         "site_statuses": result.get("site_statuses", []),
     }
+    return StreamingResponse(
+        _iter_debug_json(head, lists, tail), media_type="application/json",
+    )
+
+
+def _iter_debug_json(head: dict, lists, tail: dict):
+    """Yield the debug payload as one JSON object, a list item at a time.
+
+    Same document as a single dumps() of head + lists + tail, but the
+    intermediate listings are encoded and sent one by one instead of being
+    materialized as one large bytes object.  A sync generator, so Starlette
+    runs the encoding in its threadpool rather than on the event loop.
+    """
+    yield _dumps(head)[:-1]
+    for name, items in lists:
+        yield b',"' + name.encode() + b'":['
+        for i, item in enumerate(items):
+            yield (b"," if i else b"") + _dumps(item)
+        yield b"]"
+    yield b"," + _dumps(tail)[1:]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -537,7 +1020,7 @@ async def debug_compare(request: CompareRequest):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@app.post("/api/chat")
+@app.post("/api/chat", response_class=_OrjsonResponse)
 async def chat_endpoint(chat_req: ChatRequest):
     """POST /api/chat → Chatbot Assistant.
 
@@ -547,7 +1030,7 @@ async def chat_endpoint(chat_req: ChatRequest):
     from app.chatbot.service import run_chatbot
 
     # Redis cache check (10 min TTL, chatbot-specific key)
-    cache_key = f"chat:{chat_req.message.lower().strip()}"
+    cache_key = _ckey("chat", chat_req.message)
     cached = await _get_chatbot_cache(cache_key)
     if cached is not None:
         return cached
@@ -558,7 +1041,7 @@ async def chat_endpoint(chat_req: ChatRequest):
     # Cache successful responses only (not error fallbacks)
     _error_phrases = {"something went wrong", "i'm having trouble"}
     if not any(phrase in result.message.lower() for phrase in _error_phrases):
-        await _set_chatbot_cache(cache_key, result)
+        _fire_and_forget(_set_chatbot_cache(cache_key, result))
 
     return result
 
@@ -572,7 +1055,7 @@ async def _get_chatbot_cache(key: str):
         cached = await r.get(key)
         if cached:
             logger.info("Chatbot cache HIT: %s", key[:60])
-            return json.loads(cached)
+            return orjson.loads(cached)
     except Exception as e:
         logger.warning("Chatbot cache get error: %s", str(e)[:60])
     return None
@@ -585,7 +1068,7 @@ async def _set_chatbot_cache(key: str, result):
         return
     try:
         data = result.model_dump() if hasattr(result, "model_dump") else result
-        await r.set(key, json.dumps(data, default=str), ex=600)
+        await r.set(key, _dumps(data), ex=600)
         logger.info("Chatbot cache SET: %s (TTL=600s)", key[:60])
     except Exception as e:
         logger.warning("Chatbot cache set error: %s", str(e)[:60])
@@ -596,7 +1079,7 @@ async def _set_chatbot_cache(key: str, result):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@app.get("/")
+@app.get("/", response_class=_OrjsonResponse)
 async def root():
     return {
         "name": "AI Price Comparison",
@@ -607,7 +1090,7 @@ async def root():
     }
 
 
-@app.get("/health")
+@app.get("/health", response_class=_OrjsonResponse)
 async def health():
     enabled = marketplace_registry.all_enabled()
     return {
@@ -625,41 +1108,42 @@ async def health():
 
 @app.get("/api/marketplaces")
 async def list_marketplaces():
-    return {
-        "marketplaces": [
-            {
-                "key": m.key,
-                "name": m.name,
-                "enabled": m.enabled,
-                "base_url": m.base_url,
-                "trust_score_base": m.trust_score_base,
-            }
-            for m in marketplace_registry.all()
-        ]
-    }
+    return Response(
+        content=marketplace_registry.listing_json(), media_type="application/json",
+    )
 
 
-@app.get("/api/health/scrapers")
-async def scraper_health():
-    enabled = marketplace_registry.all_enabled()
+def _build_scraper_health(enabled) -> bytes:
     sites = [
         {
             "key": m.key,
             "name": m.name,
-            "search_url": m.search_url_pattern.format(query="test"),
+            "search_url": m.health_probe_url,
             "status": "ready",
         }
         for m in enabled
     ]
     groq_ok = bool(settings.groq_api_key)
-    return {
+    return orjson.dumps({
         "mode": "LangGraph + Groq",
         "llm_model": llm_client.primary_model if llm_client.enabled else "disabled",
         "groq_key_present": groq_ok,
         "enabled_sites": len(sites),
         "sites": sites,
         "status": "ready" if groq_ok else "ERROR: missing GROQ_API_KEY",
-    }
+    })
+
+
+@app.get("/api/health/scrapers")
+async def scraper_health():
+    # Serialized at startup and reused until the registry reloads
+    # (all_enabled() returns a new list object after every reload()).
+    enabled = marketplace_registry.all_enabled()
+    cached = getattr(app.state, "scraper_health_cache", None)
+    if cached is None or cached[0] is not enabled:
+        cached = (enabled, _build_scraper_health(enabled))
+        app.state.scraper_health_cache = cached
+    return Response(content=cached[1], media_type="application/json")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -676,21 +1160,33 @@ async def save_watchlist_item(
     result = await save_item(db, request)
 
     # Send AI-generated confirmation email on EVERY save
-    loop = asyncio.get_event_loop()
-    loop.run_in_executor(
+    _fire_and_forget(_send_watchlist_added(request))
+
+    return result
+
+
+async def _send_watchlist_added(request: SaveItemRequest) -> None:
+    # The AI text is generated on the loop (shared Groq limiter); only the
+    # blocking SMTP send goes to a thread.
+    site = request.site or ""
+    saved_price = request.saved_price or 0
+    ai_message = await generate_ai_message(
+        request.product_title, site, saved_price, request.alert_threshold,
+    )
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
         None,
         send_watchlist_added_email,
         request.user_email,
         request.product_title,
-        request.site or "",
-        request.saved_price or 0,
+        site,
+        saved_price,
         request.alert_threshold,
         request.product_url or "",
         request.thumbnail_url or "",
+        ai_message,
     )
 
-    return result
-
 
 @app.get("/api/watchlist/{user_email}", response_model=WatchlistListResponse)
 async def get_watchlist(
@@ -701,7 +1197,7 @@ async def get_watchlist(
     return await get_user_watchlist(db, user_email)
 
 
-@app.delete("/api/watchlist/remove")
+@app.delete("/api/watchlist/remove", response_class=_OrjsonResponse)
 async def remove_watchlist_item(
     request: RemoveItemRequest,
     db: AsyncSession = Depends(get_db),
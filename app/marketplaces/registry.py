@@ -1,20 +1,28 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, FrozenSet
+import orjson
 import yaml
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml's C loader parses several times faster; fall back when PyYAML was
+# built without it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(slots=True)
 class SelectorConfig:
     primary:  Optional[str]
     fallback: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketplaceSelectors:
     search_results_container: Optional[str]
     title:          SelectorConfig = field(default_factory=lambda: SelectorConfig(None))
@@ -28,7 +36,7 @@ class MarketplaceSelectors:
     seller:         Optional[SelectorConfig] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketplaceConfig:
     key:                   str
     name:                  str
@@ -46,6 +54,7 @@ class MarketplaceConfig:
     ready_selector:        Optional[str]    = None
     no_results_phrases:    List[str]        = field(default_factory=list)
     brand_affinity:        List[str]        = field(default_factory=list)
+    health_probe_url:      str              = ""   # search_url_pattern for query="test"
 
 
 def _sel(data: dict, key: str) -> SelectorConfig:
@@ -90,6 +99,7 @@ def _load(raw: dict) -> MarketplaceConfig:
         ready_selector=raw.get("ready_selector"),
         no_results_phrases=raw.get("no_results_phrases", []),
         brand_affinity=[b.lower() for b in raw.get("brand_affinity", [])],
+        health_probe_url=raw["search_url_pattern"].format(query="test"),
     )
 
 
@@ -97,33 +107,93 @@ class MarketplaceRegistry:
     def __init__(self, configs_dir: str):
         self._dir     = configs_dir
         self._configs: Dict[str, MarketplaceConfig] = {}
+        # path -> (st_mtime_ns, st_size, parsed config); unchanged files skip YAML parsing
+        self._parse_cache: Dict[str, Tuple[int, int, MarketplaceConfig]] = {}
+        # Rebuilt once per reload(); tuples, so callers can't mutate them.
+        self._all:          Tuple[MarketplaceConfig, ...] = ()
+        self._enabled:      Tuple[MarketplaceConfig, ...] = ()
+        self._enabled_keys: FrozenSet[str]          = frozenset()
+        self._listing_json: bytes                   = b'{"marketplaces":[]}'
         self.reload()
 
-    def reload(self):
-        self._configs.clear()
+    def _yaml_paths(self) -> Optional[List[str]]:
         if not os.path.isdir(self._dir):
             logger.warning(f"Configs dir not found: {self._dir}")
+            return None
+        return [
+            os.path.join(self._dir, fname)
+            for fname in sorted(os.listdir(self._dir))
+            if fname.endswith(".yaml")
+        ]
+
+    def _parse_one(self, path: str) -> Optional[MarketplaceConfig]:
+        """Parse one config file, reusing the cached result if it is unchanged."""
+        try:
+            st = os.stat(path)
+            cached = self._parse_cache.get(path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            with open(path, encoding="utf-8") as f:
+                raw = yaml.load(f, Loader=_YamlLoader)
+            if raw and raw.get("key"):
+                cfg = _load(raw)
+                self._parse_cache[path] = (st.st_mtime_ns, st.st_size, cfg)
+                logger.debug(f"Loaded marketplace: {cfg.key} ({cfg.name})")
+                return cfg
+        except Exception as e:
+            self._parse_cache.pop(path, None)
+            logger.error(f"Failed to load {os.path.basename(path)}: {e}")
+        return None
+
+    def _apply(self, paths: List[str], parsed: List[Optional[MarketplaceConfig]]):
+        configs: Dict[str, MarketplaceConfig] = {}
+        for cfg in parsed:
+            if cfg is not None:
+                configs[cfg.key] = cfg
+        for stale in self._parse_cache.keys() - set(paths):
+            del self._parse_cache[stale]
+
+        # Swap in whole objects so concurrent readers never see a half-built registry
+        all_ = tuple(configs.values())
+        enabled = tuple(c for c in all_ if c.enabled)
+        self._listing_json = orjson.dumps({
+            "marketplaces": [
+                {
+                    "key": c.key,
+                    "name": c.name,
+                    "enabled": c.enabled,
+                    "base_url": c.base_url,
+                    "trust_score_base": c.trust_score_base,
+                }
+                for c in all_
+            ]
+        })
+        self._configs      = configs
+        self._all          = all_
+        self._enabled      = enabled
+        self._enabled_keys = frozenset(c.key for c in enabled)
+        logger.info(f"Registry: {len(configs)} marketplaces loaded")
+
+    def reload(self):
+        paths = self._yaml_paths()
+        if paths is None:
+            self._apply([], [])
             return
-        for fname in sorted(os.listdir(self._dir)):
-            if not fname.endswith(".yaml"):
-                continue
-            path = os.path.join(self._dir, fname)
-            try:
-                with open(path, encoding="utf-8") as f:
-                    raw = yaml.safe_load(f)
-                if raw and raw.get("key"):
-                    cfg = _load(raw)
-                    self._configs[cfg.key] = cfg
-                    logger.debug(f"Loaded marketplace: {cfg.key} ({cfg.name})")
-            except Exception as e:
-                logger.error(f"Failed to load {fname}: {e}")
-        logger.info(f"Registry: {len(self._configs)} marketplaces loaded")
-
-    def all(self) -> List[MarketplaceConfig]:
-        return list(self._configs.values())
-
-    def all_enabled(self) -> List[MarketplaceConfig]:
-        return [c for c in self._configs.values() if c.enabled]
+        self._apply(paths, [self._parse_one(p) for p in paths])
+
+    def all(self) -> Tuple[MarketplaceConfig, ...]:
+        return self._all
+
+    def all_enabled(self) -> Tuple[MarketplaceConfig, ...]:
+        return self._enabled
+
+    def enabled_keys(self) -> FrozenSet[str]:
+        """Keys of all enabled marketplaces, for O(1) membership checks."""
+        return self._enabled_keys
+
+    def listing_json(self) -> bytes:
+        """Pre-serialized /api/marketplaces body, rebuilt on reload()."""
+        return self._listing_json
 
     def get(self, key: str) -> Optional[MarketplaceConfig]:
         return self._configs.get(key)
@@ -7,8 +7,8 @@ Pydantic v2 compliant — no class Config anywhere.
 """
 from __future__ import annotations
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, model_validator
+from typing import Dict, List, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -32,6 +32,17 @@ class SiteStatusCode(str, Enum):
     ERROR         = "error"
 
 
+# SiteStatus.status → master prompt status_string
+_STATUS_STRINGS = {
+    SiteStatusCode.OK:            "success",
+    SiteStatusCode.BOT_CHALLENGE: "blocked",
+    SiteStatusCode.NO_RESULTS:    "no_results",
+    SiteStatusCode.ERROR:         "parse_error",
+    SiteStatusCode.TIMEOUT:       "blocked",
+    SiteStatusCode.PENDING:       "pending",
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # REQUEST / PREFERENCES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -74,7 +85,6 @@ class ProductAttributes(BaseModel):
     category:        Optional[str]  = None
     raw_query:       Optional[str]  = None
     image_url:       Optional[str]  = None
-    extras:          Dict[str, Any] = Field(default_factory=dict)
     variant_tokens:  List[str]      = Field(default_factory=list)
     target_keywords: List[str]      = Field(default_factory=list)
 
@@ -131,15 +141,7 @@ class SiteStatus(BaseModel):
         if not self.listing_count:
             self.listing_count = self.listings_found
         if not self.status_string:
-            _map = {
-                SiteStatusCode.OK: "success",
-                SiteStatusCode.BOT_CHALLENGE: "blocked",
-                SiteStatusCode.NO_RESULTS: "no_results",
-                SiteStatusCode.ERROR: "parse_error",
-                SiteStatusCode.TIMEOUT: "blocked",
-                SiteStatusCode.PENDING: "pending",
-            }
-            self.status_string = _map.get(self.status, "error")
+            self.status_string = _STATUS_STRINGS.get(self.status, "error")
         return self
 
 
@@ -158,7 +160,6 @@ class RawListing(BaseModel):
     warranty_text:        Optional[str]  = None
     image_url:            Optional[str]  = None
     coupon_text:          Optional[str]  = None
-    extra:                Dict[str, Any] = Field(default_factory=dict)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -167,6 +168,8 @@ class RawListing(BaseModel):
 
 
 class ScoreBreakdown(BaseModel):
+    model_config = {"frozen": True}
+
     price_score:    float = 0.0
     delivery_score: float = 0.0
     trust_score:    float = 0.0
@@ -273,6 +276,19 @@ class PipelineState(BaseModel):
     errors:      List[str] = Field(default_factory=list)
     explanation: str       = ""
 
+    # marketplace_key → position in site_statuses, plus the list object and
+    # length it was built from; rebuilt when either no longer matches
+    _site_status_pos:     Dict[str, int]               = PrivateAttr(default_factory=dict)
+    _site_status_indexed: Optional[List[SiteStatus]]   = PrivateAttr(default=None)
+    _site_status_count:   int                          = PrivateAttr(default=0)
+
+    def __copy__(self):
+        # model_copy() shares private values — give the copy its own index
+        copied = super().__copy__()
+        copied._site_status_pos = {}
+        copied._site_status_indexed = None
+        return copied
+
     # ── Helpers ───────────────────────────────────────────────────────────────
 
     def add_error(self, msg: str) -> None:
@@ -305,30 +321,70 @@ class PipelineState(BaseModel):
         # ── Style 1: full SiteStatus object passed ────────────────────────────
         if isinstance(status_or_key, SiteStatus):
             obj = status_or_key
-            for existing in self.site_statuses:
-                if existing.marketplace_key == obj.marketplace_key:
-                    existing.status         = obj.status
-                    existing.message        = obj.message
-                    existing.listings_found = obj.listings_found
-                    return
-            self.site_statuses.append(obj)
+            existing = self._find_site_status(obj.marketplace_key)
+            if existing is not None:
+                existing.status         = obj.status
+                existing.message        = obj.message
+                existing.listings_found = obj.listings_found
+                return
+            self._append_site_status(obj)
             return
 
         # ── Style 2: individual fields passed ────────────────────────────────
         marketplace_key = str(status_or_key)
-        for existing in self.site_statuses:
-            if existing.marketplace_key == marketplace_key:
-                existing.status         = status
-                existing.message        = message
-                existing.listings_found = listings_found
-                return
-        self.site_statuses.append(SiteStatus(
+        existing = self._find_site_status(marketplace_key)
+        if existing is not None:
+            existing.status         = status
+            existing.message        = message
+            existing.listings_found = listings_found
+            return
+        obj = SiteStatus(
             marketplace_key=marketplace_key,
             marketplace_name=marketplace_name,
             status=status,
             message=message,
             listings_found=listings_found,
-        ))
+        )
+        self._append_site_status(obj)
+
+    def _find_site_status(self, marketplace_key: str) -> Optional[SiteStatus]:
+        statuses = self._site_status_list()
+        i = self._site_status_pos.get(marketplace_key)
+        if i is None:
+            return None
+        existing = statuses[i]
+        if existing.marketplace_key != marketplace_key:
+            # An entry was replaced in place — reindex and look again
+            self._reindex_site_statuses()
+            i = self._site_status_pos.get(marketplace_key)
+            return None if i is None else statuses[i]
+        return existing
+
+    def _append_site_status(self, obj: SiteStatus) -> None:
+        statuses = self._site_status_list()
+        self._site_status_pos.setdefault(obj.marketplace_key, len(statuses))
+        statuses.append(obj)
+        self._site_status_count += 1
+
+    def _site_status_list(self) -> List[SiteStatus]:
+        """site_statuses, with the index rebuilt if the list was reassigned
+        or appended to directly."""
+        statuses = self.site_statuses
+        if (
+            statuses is not self._site_status_indexed
+            or len(statuses) != self._site_status_count
+        ):
+            self._reindex_site_statuses()
+        return statuses
+
+    def _reindex_site_statuses(self) -> None:
+        statuses = self.site_statuses
+        pos: Dict[str, int] = {}
+        for i, existing in enumerate(statuses):
+            pos.setdefault(existing.marketplace_key, i)   # first match wins
+        self._site_status_pos = pos
+        self._site_status_indexed = statuses
+        self._site_status_count = len(statuses)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -337,6 +393,8 @@ class PipelineState(BaseModel):
 
 
 class CountsSummary(BaseModel):
+    model_config = {"frozen": True}
+
     raw_listings:      int = 0
     normalized_offers: int = 0
     matched_offers:    int = 0
@@ -344,6 +402,8 @@ class CountsSummary(BaseModel):
 
 
 class CompareResponse(BaseModel):
+    model_config = {"frozen": True}
+
     query_time_seconds:    float                       = 0.0
     normalized_product:    Optional[NormalizedProduct] = None
     selected_marketplaces: List[str]                   = Field(default_factory=list)
@@ -355,9 +415,3 @@ class CompareResponse(BaseModel):
     site_statuses:         List[SiteStatus]            = Field(default_factory=list)
     explanation:           Optional[str]               = None
     errors:                List[str]                   = Field(default_factory=list)
-
-
-class DebugCompareResponse(CompareResponse):
-    """Extended response for /api/debug/compare."""
-    raw_listings:            List[RawListing]     = Field(default_factory=list)
-    normalized_before_match: List[NormalizedOffer] = Field(default_factory=list)
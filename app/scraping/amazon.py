@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """
-Amazon India scraper — Playwright fetch + BeautifulSoup parse.
+Amazon India scraper — Playwright fetch + selectolax/BeautifulSoup parse.
 
 Uses Playwright (stealth Chromium) to fetch the page HTML (Amazon blocks
 plain HTTP with 503), then parses product cards with CSS selectors via
-BeautifulSoup. No LLM is needed — structured data is extracted directly.
+selectolax (Lexbor), or BeautifulSoup when selectolax isn't installed.
+No LLM is needed — structured data is extracted directly.
 """
 from __future__ import annotations
 
@@ -14,11 +15,14 @@ import re
 from typing import List, Optional, Tuple
 from urllib.parse import quote_plus, urljoin, urlparse, unquote
 
-from bs4 import BeautifulSoup
-
 from app.schemas import RawListing, SiteStatus, SiteStatusCode
 from app.scraping.base import parse_price, parse_rating
-from app.config import settings
+from app.scraping.browser import (
+    BLOCKED_RESOURCE_TYPES, block_resources, get_browser, scroll_for_lazy_load,
+)
+from app.scraping.html import (
+    compile_selector, css_all, css_first, node_attr, node_text, page_text, parse_html,
+)
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +31,8 @@ logger = get_logger(__name__)
 
 _BASE_URL = "https://www.amazon.in"
 _SEARCH_URL = "https://www.amazon.in/s?k={query}&i=electronics&s=review-rank"
+_PLATFORM_KEY = "amazon"
+_SELLER_TEXT = "Amazon.in"
 
 _BOT_PHRASES = [
     "enter the characters you see below",
@@ -37,6 +43,42 @@ _BOT_PHRASES = [
     "robot",
 ]
 
+# ── Selectors ────────────────────────────────────────────────────────────────
+# Compiled once for the shared HTML backend (app.scraping.html).  Selector
+# tuples are priority chains for _sel().
+
+def _css(*selectors: str) -> tuple:
+    return tuple(compile_selector(s) for s in selectors)
+
+_SEL_CARDS          = compile_selector("[data-component-type='s-search-result']")
+_SEL_CARDS_FALLBACK = compile_selector("div[data-asin]:not([data-asin=''])")
+_SEL_TITLE    = _css("h2 .a-text-normal", "h2 a span", "h2 a", "h2")
+_SEL_URL      = _css("h2 a[href]", "a.a-link-normal[href*='/dp/']", "a[href*='/dp/']")
+_SEL_PRICE    = _css(".a-price .a-offscreen", ".a-price-whole")
+_SEL_WHOLE    = compile_selector(".a-price-whole")
+_SEL_FRACTION = compile_selector(".a-price-fraction")
+_SEL_MRP      = _css(".a-text-price .a-offscreen", ".a-text-price span")
+_SEL_RATING   = _css(".a-icon-star-small .a-icon-alt",
+                     "[aria-label*='out of 5 stars']", "i.a-icon-star-small")
+_SEL_REVIEWS  = _css(".a-size-base.s-underline-text",
+                     "[aria-label*='ratings']", "span.a-size-base")
+_SEL_IMAGE    = _css("img.s-image", "img[data-image-latency='s-product-image']",
+                     ".s-image-square-aspect img", "img[src*='images-amazon']")
+_SEL_DELIVERY = _css("[data-cy='delivery-recipe-content'] .a-text-bold",
+                     ".a-color-base.a-text-bold",
+                     "span[data-component-type='s-delivery-badge']",
+                     "[aria-label*='delivery']")
+_SEL_PRIME    = compile_selector("i.a-icon-prime, [aria-label*='Prime']")
+
+# Fallback delivery estimates when a card carries no delivery line
+_DELIVERY_PRIME   = "Prime — 2 days"
+_DELIVERY_DEFAULT = "5 days (estimated)"
+
+_REVIEW_COUNT_RE = re.compile(r'[\d,]+')
+
+# Card data is all in the server-rendered HTML, so CSS can go too
+_BLOCKED_TYPES = BLOCKED_RESOURCE_TYPES | {"stylesheet"}
+
 _SLUG_NOISE = {
     "dp", "ref", "sr", "qid", "keywords", "crid", "sprefix",
     "encoding", "psc", "tag", "linkcode", "camp", "creative",
@@ -83,7 +125,7 @@ _STEALTH_JS = """
 
 class AmazonScraper:
     """
-    Scrape Amazon India: Playwright fetches (bypasses 503), BS4 parses.
+    Scrape Amazon India: Playwright fetches (bypasses 503), selectolax (or BS4) parses.
     No LLM needed — uses CSS selectors directly.
     """
 
@@ -123,7 +165,7 @@ class AmazonScraper:
             return [], status
 
     async def _scrape_async(self, query: str, max_results: int) -> List[RawListing]:
-        """Fetch via Playwright, parse via BeautifulSoup."""
+        """Fetch via Playwright, parse via selectolax (or BeautifulSoup)."""
         url = _SEARCH_URL.format(query=quote_plus(query))
 
         for attempt in range(1, 3):
@@ -135,27 +177,21 @@ class AmazonScraper:
                     await asyncio.sleep(random.uniform(2, 4))
                 continue
 
-            soup = BeautifulSoup(html, "lxml")
+            tree = parse_html(html)
 
-            # Bot check
-            page_lower = soup.get_text(" ", strip=True).lower()
-            bot_found = None
-            for phrase in _BOT_PHRASES:
-                if phrase in page_lower:
-                    bot_found = phrase
-                    break
+            # Parse product cards
+            listings = self._parse_results(tree, max_results)
+            if listings:
+                return listings
+
+            # Bot check — only pages without results need the full-text scan
+            # (a challenge page has no product cards)
+            bot_found = _bot_phrase(tree)
             if bot_found:
                 logger.warning("[AmazonScraper] Bot challenge (attempt %d): '%s'",
                                attempt, bot_found)
                 if attempt < 2:
                     await asyncio.sleep(random.uniform(3, 6))
-                continue
-
-            # Parse product cards
-            listings = self._parse_results(soup, max_results)
-
-            if listings:
-                return listings
             elif attempt < 2:
                 logger.info("[AmazonScraper] 0 listings, retrying...")
                 await asyncio.sleep(random.uniform(2, 4))
@@ -165,74 +201,56 @@ class AmazonScraper:
     # ── Playwright fetch ─────────────────────────────────────────────────
 
     async def _fetch_with_playwright(self, url: str, attempt: int) -> str:
-        from playwright.async_api import async_playwright
-
         ua = random.choice(_USER_AGENTS)
+        ctx = None
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=settings.playwright_headless,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-infobars",
-                        "--no-first-run",
-                        "--no-default-browser-check",
-                        "--disable-dev-shm-usage",
-                        "--disable-gpu",
-                        "--no-sandbox",
-                    ],
-                )
-                ctx = await browser.new_context(
-                    user_agent=ua,
-                    viewport={"width": 1366, "height": 768},
-                    locale="en-IN",
-                    timezone_id="Asia/Kolkata",
-                    bypass_csp=True,
-                    extra_http_headers={
-                        "Accept-Language": "en-IN,en;q=0.9",
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    },
-                )
-                await ctx.add_init_script(_STEALTH_JS)
-                page = await ctx.new_page()
-
-                # Block heavy resources
-                await page.route(
-                    "**/*",
-                    lambda route: route.abort()
-                    if route.request.resource_type in ("font", "media", "image")
-                    else route.continue_(),
-                )
-
-                logger.info("[AmazonScraper] Navigating (attempt %d): %s",
-                            attempt, url[:80])
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                await asyncio.sleep(3.0 + random.uniform(0.5, 1.5))
-
-                # Scroll to trigger lazy loading
-                for pct in [0.3, 0.5, 0.7]:
-                    await page.evaluate(
-                        f"window.scrollTo(0, document.body.scrollHeight * {pct})"
-                    )
-                    await asyncio.sleep(0.4 + random.uniform(0.1, 0.4))
-
-                html = await page.content()
-                logger.info("[AmazonScraper] Got %d chars of HTML", len(html))
-
-                await browser.close()
-                return html
+            # Shared browser; only the context is per-fetch
+            browser = await get_browser()
+            ctx = await browser.new_context(
+                user_agent=ua,
+                viewport={"width": 1366, "height": 768},
+                locale="en-IN",
+                timezone_id="Asia/Kolkata",
+                bypass_csp=True,
+                extra_http_headers={
+                    "Accept-Language": "en-IN,en;q=0.9",
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                },
+            )
+            await ctx.add_init_script(_STEALTH_JS)
+            # Block heavy resources and trackers
+            await block_resources(ctx, _BLOCKED_TYPES)
+            page = await ctx.new_page()
+
+            logger.info("[AmazonScraper] Navigating (attempt %d): %s",
+                        attempt, url[:80])
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            await asyncio.sleep(3.0 + random.uniform(0.5, 1.5))
+
+            # Scroll to trigger lazy loading
+            await scroll_for_lazy_load(page)
+
+            html = await page.content()
+            logger.info("[AmazonScraper] Got %d chars of HTML", len(html))
+            return html
 
         except Exception as e:
             logger.error("[AmazonScraper] Playwright error (attempt %d): %s",
                          attempt, str(e)[:120])
             return ""
+        finally:
+            if ctx is not None:
+                try:
+                    await ctx.close()
+                except Exception:
+                    pass
 
-    # ── BS4 parsing ──────────────────────────────────────────────────────
+    # ── HTML parsing ─────────────────────────────────────────────────────
 
-    def _parse_results(self, soup: BeautifulSoup, max_results: int) -> List[RawListing]:
-        cards = soup.select("[data-component-type='s-search-result']")
+    def _parse_results(self, tree, max_results: int) -> List[RawListing]:
+        cards = css_all(tree, _SEL_CARDS)
         if not cards:
-            cards = soup.select("div[data-asin]:not([data-asin=''])")
+            cards = css_all(tree, _SEL_CARDS_FALLBACK)
             logger.info("[AmazonScraper] Fallback selector: %d cards", len(cards))
 
         logger.info("[AmazonScraper] Found %d product cards", len(cards))
@@ -254,15 +272,15 @@ class AmazonScraper:
 
     def _parse_card(self, card) -> Optional[RawListing]:
         # Title
-        title_el = _sel(card, "h2 .a-text-normal", "h2 a span", "h2 a", "h2")
-        title = _text(title_el)
+        title_el = _sel(card, _SEL_TITLE)
+        title = node_text(title_el)
 
         # URL
-        url_el = _sel(card, "h2 a[href]", "a.a-link-normal[href*='/dp/']",
-                       "a[href*='/dp/']")
+        url_el = _sel(card, _SEL_URL)
         listing_url = ""
-        if url_el and url_el.get("href"):
-            listing_url = urljoin(_BASE_URL, url_el["href"].split("/ref=")[0])
+        href = node_attr(url_el, "href") if url_el else None
+        if href:
+            listing_url = _absolute_url(href.partition("/ref=")[0])
 
         if not title and listing_url:
             title = _title_from_slug(listing_url)
@@ -270,100 +288,92 @@ class AmazonScraper:
             return None
 
         # Price
-        price_el = _sel(card, ".a-price .a-offscreen", ".a-price-whole")
-        price_text = _text(price_el)
+        price_el = _sel(card, _SEL_PRICE)
+        price_text = node_text(price_el) or None
         if not price_text or not parse_price(price_text):
-            whole_el = card.select_one(".a-price-whole")
-            frac_el  = card.select_one(".a-price-fraction")
+            whole_el = css_first(card, _SEL_WHOLE)
+            frac_el  = css_first(card, _SEL_FRACTION)
             if whole_el:
-                whole = _text(whole_el).rstrip(".")
-                frac  = _text(frac_el) if frac_el else "00"
+                whole = node_text(whole_el).rstrip(".")
+                frac  = node_text(frac_el) if frac_el else "00"
                 price_text = f"₹{whole}.{frac}"
 
         # MRP
-        mrp_el = _sel(card, ".a-text-price .a-offscreen", ".a-text-price span")
-        original_price_text = _text(mrp_el) or None
+        mrp_el = _sel(card, _SEL_MRP)
+        original_price_text = node_text(mrp_el) or None
 
         # Rating
-        rating_el = _sel(card, ".a-icon-star-small .a-icon-alt",
-                         "[aria-label*='out of 5 stars']", "i.a-icon-star-small")
+        rating_el = _sel(card, _SEL_RATING)
         rating_text = None
         if rating_el:
-            raw = rating_el.get("aria-label") or _text(rating_el)
+            raw = node_attr(rating_el, "aria-label") or node_text(rating_el)
             parsed = parse_rating(raw)
             if parsed is not None:
                 rating_text = str(parsed)
 
         # Review count
-        review_el = _sel(card, ".a-size-base.s-underline-text",
-                         "[aria-label*='ratings']", "span.a-size-base")
+        review_el = _sel(card, _SEL_REVIEWS)
         review_count_text = None
         if review_el:
-            m = re.search(r'[\d,]+', _text(review_el).replace('\xa0', ''))
+            m = _REVIEW_COUNT_RE.search(node_text(review_el).replace('\xa0', ''))
             if m:
                 review_count_text = m.group(0)
 
-        # Delivery
-        delivery_text = _extract_delivery(card)
-
-        # Shipping
-        shipping_text = _extract_shipping(card, price_text)
+        # Delivery / shipping — the Prime badge feeds both, so look it up once
+        is_prime = bool(css_first(card, _SEL_PRIME))
+        delivery_text = _extract_delivery(card, is_prime)
+        shipping_text = _extract_shipping(is_prime, price_text)
 
         # Product image thumbnail
-        img_el = _sel(card, "img.s-image", "img[data-image-latency='s-product-image']",
-                       ".s-image-square-aspect img", "img[src*='images-amazon']")
+        img_el = _sel(card, _SEL_IMAGE)
         image_url = None
         if img_el:
-            image_url = img_el.get("src") or img_el.get("data-src") or None
+            image_url = node_attr(img_el, "src") or node_attr(img_el, "data-src") or None
 
         return RawListing(
-            platform_key="amazon",
+            platform_key=_PLATFORM_KEY,
             listing_url=listing_url,
             title=title,
-            price_text=price_text or None,
+            price_text=price_text,
             original_price_text=original_price_text,
             rating_text=rating_text,
             review_count_text=review_count_text,
             delivery_text=delivery_text,
             shipping_text=shipping_text,
-            seller_text="Amazon.in",
+            seller_text=_SELLER_TEXT,
             image_url=image_url,
         )
 
 
 # ── Helper functions ─────────────────────────────────────────────────────────
 
-def _text(el) -> str:
-    return el.get_text(strip=True) if el else ""
+def _sel(card, patterns: tuple):
+    for pat in patterns:
+        found = css_first(card, pat)
+        if found:
+            return found
+    return None
 
-def _sel(card, *selectors):
-    for sel in selectors:
-        if sel:
-            found = card.select_one(sel)
-            if found:
-                return found
+def _bot_phrase(tree) -> Optional[str]:
+    # Plain substring tests on one lowered copy: for six phrases this beats a
+    # case-insensitive alternation regex over the same text by ~10x.
+    page_lower = page_text(tree).lower()
+    for phrase in _BOT_PHRASES:
+        if phrase in page_lower:
+            return phrase
     return None
 
-def _extract_delivery(card) -> Optional[str]:
-    for sel in [
-        "[data-cy='delivery-recipe-content'] .a-text-bold",
-        ".a-color-base.a-text-bold",
-        "span[data-component-type='s-delivery-badge']",
-        "[aria-label*='delivery']",
-    ]:
-        el = card.select_one(sel)
+def _extract_delivery(card, is_prime: bool) -> Optional[str]:
+    for pat in _SEL_DELIVERY:
+        el = css_first(card, pat)
         if el:
-            text = _text(el)
+            text = node_text(el)
             if text and len(text) > 2:
                 return text
-    prime = card.select_one("i.a-icon-prime, [aria-label*='Prime']")
-    if prime:
-        return "Prime — 2 days"
-    return "5 days (estimated)"
-
-def _extract_shipping(card, price_text: Optional[str]) -> Optional[str]:
-    prime = card.select_one("i.a-icon-prime, [aria-label*='Prime']")
-    if prime:
+    return _DELIVERY_PRIME if is_prime else _DELIVERY_DEFAULT
+
+def _extract_shipping(is_prime: bool, price_text: Optional[str]) -> Optional[str]:
+    if is_prime:
         return "Free (Prime)"
     if price_text:
         val = parse_price(price_text)
@@ -371,6 +381,13 @@ def _extract_shipping(card, price_text: Optional[str]) -> Optional[str]:
             return "Free delivery"
     return None
 
+def _absolute_url(href: str) -> str:
+    # Card links are almost always root-relative ("/Some-Product/dp/..."),
+    # which only need the origin prepended; anything else goes to urljoin.
+    if href.startswith("/") and not href.startswith("//"):
+        return _BASE_URL + href
+    return urljoin(_BASE_URL, href)
+
 def _title_from_slug(url: str) -> str:
     try:
         path = urlparse(url).path
@@ -5,17 +5,21 @@ and price / rating / delivery parsing for Indian e-commerce sites.
 """
 from __future__ import annotations
 
+import asyncio
 import random
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple
 from urllib.parse import quote_plus
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 from app.schemas import RawListing, SiteStatus, SiteStatusCode
+from app.scraping.html import HtmlNode
+from app.utils.executors import get_http_pool
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +42,44 @@ _USER_AGENTS = [
 ]
 
 
+_BROWSER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-IN,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+
+# ── Shared HTTP session ──────────────────────────────────────────────────────
+# One keep-alive connection pool for every requests-based scraper, so repeat
+# queries to the same marketplace reuse TCP/TLS connections.  Scrapers run in
+# HTTP pool threads, hence the threading lock.
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                # pool_connections: hosts kept; pool_maxsize: one per HTTP pool worker
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=8, max_retries=0)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers.update(_BROWSER_HEADERS)
+                _session = s
+    return _session
+
+
 # ── Price / rating / delivery parsers ────────────────────────────────────────
 
 # Indian price regex: handles ₹55,999 | Rs 1,29,999 | Rs. 55999 | bare 55999
@@ -49,6 +91,14 @@ _PRICE_RE = re.compile(
     r'(?:\.\d{1,2})?'               # optional .00
 )
 
+_RATING_OUT_OF_5_RE = re.compile(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', re.I)
+_RATING_NUM_RE      = re.compile(r'(\d+\.?\d*)')
+
+# Delivery patterns run on lower-cased text
+_DELIVERY_RANGE_RE = re.compile(r'(\d+)\s*(?:to|-)\s*(\d+)\s*day')
+_DELIVERY_DAYS_RE  = re.compile(r'(\d+)\s*day')
+_WEEKDAY_RE        = re.compile(r'(mon|tue|wed|thu|fri|sat|sun)')
+
 
 def parse_price(text: Optional[str]) -> Optional[float]:
     """Extract first numeric price from an Indian price string."""
@@ -68,10 +118,10 @@ def parse_rating(text: Optional[str]) -> Optional[float]:
     """Extract star rating float from text like '4.3 out of 5 stars'."""
     if not text:
         return None
-    m = re.search(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', text, re.I)
+    m = _RATING_OUT_OF_5_RE.search(text)
     if m:
         return min(float(m.group(1)), 5.0)
-    m = re.search(r'(\d+\.?\d*)', text)
+    m = _RATING_NUM_RE.search(text)
     if m:
         val = float(m.group(1))
         return val if val <= 5.0 else None
@@ -87,14 +137,14 @@ def parse_delivery_days(text: Optional[str]) -> Optional[int]:
         return 1
     if 'today' in t:
         return 0
-    m = re.search(r'(\d+)\s*(?:to|-)\s*(\d+)\s*day', t)
+    m = _DELIVERY_RANGE_RE.search(t)
     if m:
         return int(m.group(2))  # take the max
-    m = re.search(r'(\d+)\s*day', t)
+    m = _DELIVERY_DAYS_RE.search(t)
     if m:
         return int(m.group(1))
     # Date-based: "Mon, 3 Mar" etc — approximate as ~3 days
-    if re.search(r'(mon|tue|wed|thu|fri|sat|sun)', t):
+    if _WEEKDAY_RE.search(t):
         return 3
     return None
 
@@ -103,7 +153,7 @@ def parse_delivery_days(text: Optional[str]) -> Optional[int]:
 
 class BaseScraper(ABC):
     """
-    HTTP + BeautifulSoup scraper base class.
+    HTTP + HTML-parser scraper base class.
 
     Subclasses implement `scrape()` which returns a list of RawListing.
     The base class provides session management, polite delays, and retries.
@@ -113,48 +163,31 @@ class BaseScraper(ABC):
     BASE_DELAY  = (1.0, 3.0)   # random delay range between requests (seconds)
     TIMEOUT     = 15            # HTTP timeout
 
-    def __init__(self):
-        self._session: Optional[requests.Session] = None
-
     # ── Session ──────────────────────────────────────────────────────────
 
     def _get_session(self) -> requests.Session:
-        if self._session is None:
-            self._session = requests.Session()
-            self._rotate_ua()
-        return self._session
-
-    def _rotate_ua(self) -> None:
-        ua = random.choice(_USER_AGENTS)
-        s = self._get_session()
-        s.headers.update({
-            "User-Agent": ua,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-IN,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        })
+        return _get_session()
 
     # ── HTTP fetch with retries ──────────────────────────────────────────
 
-    def fetch(self, url: str) -> Optional[BeautifulSoup]:
-        """GET url → BeautifulSoup (lxml). Returns None on persistent failure."""
+    def fetch(self, url: str) -> Optional[HtmlNode]:
+        """GET url → parsed HtmlNode (Lexbor, or BeautifulSoup as fallback).
+
+        Returns None on persistent failure.
+        """
         session = self._get_session()
 
         for attempt in range(1, self.MAX_RETRIES + 1):
-            self._rotate_ua()  # fresh UA each attempt
             self._polite_delay()
 
             try:
                 logger.info("[%s] GET (attempt %d): %s",
                             self.__class__.__name__, attempt, url[:100])
-                resp = session.get(url, timeout=self.TIMEOUT)
+                # Fresh UA each attempt, per request — the session is shared
+                resp = session.get(
+                    url, timeout=self.TIMEOUT,
+                    headers={"User-Agent": random.choice(_USER_AGENTS)},
+                )
 
                 if resp.status_code == 429:
                     wait = 2 ** attempt + random.uniform(1, 3)
@@ -175,7 +208,7 @@ class BaseScraper(ABC):
                                    self.__class__.__name__, resp.status_code, url[:80])
                     return None
 
-                return BeautifulSoup(resp.text, "lxml")
+                return HtmlNode.parse(resp.text)
 
             except requests.RequestException as e:
                 logger.error("[%s] Request error (attempt %d): %s",
@@ -191,12 +224,12 @@ class BaseScraper(ABC):
         time.sleep(random.uniform(*self.BASE_DELAY))
 
     @staticmethod
-    def _text(el) -> str:
-        """Get stripped text from a BS4 element, or empty string."""
-        return el.get_text(strip=True) if el else ""
+    def _text(el: Optional[HtmlNode]) -> str:
+        """Get stripped text from an element, or empty string."""
+        return el.text() if el else ""
 
     @staticmethod
-    def _select_first(card, *selectors) -> Optional[object]:
+    def _select_first(card: HtmlNode, *selectors) -> Optional[HtmlNode]:
         """Try multiple CSS selectors; return first match or None."""
         for sel in selectors:
             if not sel:
@@ -223,11 +256,9 @@ class BaseScraper(ABC):
         site_name: str,
     ) -> Tuple[List[RawListing], SiteStatus]:
         """
-        Run synchronous `scrape()` in a thread-pool executor and return
+        Run synchronous `scrape()` in the shared HTTP thread pool and return
         (listings, SiteStatus) matching the orchestrator interface.
         """
-        import asyncio
-
         status = SiteStatus(
             marketplace_key=site_key,
             marketplace_name=site_name,
@@ -237,9 +268,9 @@ class BaseScraper(ABC):
         )
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             listings = await loop.run_in_executor(
-                None, self.scrape, query, max_results,
+                get_http_pool(), self.scrape, query, max_results,
             )
 
             if listings:
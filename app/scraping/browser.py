@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Shared headless Chromium for the dedicated Playwright scrapers.
+
+Launching Chromium costs 1-2 s per call; opening a browser context on an
+already-running browser costs tens of milliseconds.  Scrapers therefore take
+the process-wide browser from get_browser() and open (and close) their own
+context per fetch, which keeps cookies and storage isolated per request.
+
+The browser is launched lazily on first use and relaunched if it crashes or
+disconnects.  close_browser() is called from the FastAPI lifespan shutdown.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from typing import Optional, Sequence, Tuple
+
+from playwright.async_api import async_playwright
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-sandbox",
+]
+
+# Subresources the HTML scrapers never need.  Images/fonts/media are dropped by
+# type; ad and analytics beacons by host, whatever their type.
+BLOCKED_RESOURCE_TYPES = frozenset({"font", "media", "image"})
+_BLOCKED_HOSTS_RE = re.compile(
+    r"(?:doubleclick|googletagmanager|google-analytics|googlesyndication"
+    r"|amazon-adsystem|fls-na\.amazon|facebook\.net|hotjar)"
+)
+
+# Scroll through the page in one CDP call; the pauses between steps run in the
+# browser (setTimeout) instead of as one evaluate() round trip per step.
+_SCROLL_JS = """
+async ([stops, pauses]) => {
+    for (let i = 0; i < stops.length; i++) {
+        window.scrollTo(0, document.body.scrollHeight * stops[i]);
+        await new Promise(r => setTimeout(r, pauses[i]));
+    }
+}
+"""
+
+_playwright = None
+_browser = None
+_launch_lock: Optional[asyncio.Lock] = None
+
+
+def _get_launch_lock() -> asyncio.Lock:
+    global _launch_lock
+    if _launch_lock is None:
+        _launch_lock = asyncio.Lock()
+    return _launch_lock
+
+
+async def get_browser():
+    """Return the shared Chromium instance, launching it on first use."""
+    global _playwright, _browser
+    if _browser is not None and _browser.is_connected():
+        return _browser
+
+    async with _get_launch_lock():
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(
+                headless=settings.playwright_headless,
+                args=_LAUNCH_ARGS,
+            )
+            logger.info("Shared Chromium launched")
+    return _browser
+
+
+async def close_browser() -> None:
+    """Close the shared browser and stop Playwright. Call from lifespan shutdown."""
+    global _playwright, _browser
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception as e:
+            logger.debug("Shared Chromium close failed: %s", e)
+        _browser = None
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        except Exception as e:
+            logger.debug("Playwright stop failed: %s", e)
+        _playwright = None
+
+
+async def scroll_for_lazy_load(
+    page,
+    stops: Sequence[float] = (0.3, 0.5, 0.7),
+    pause: Tuple[float, float] = (0.5, 0.8),
+) -> None:
+    """Scroll to each fraction of the page height, pausing a random
+    pause[0]..pause[1] seconds after each step (human-ish, for lazy loaders)."""
+    pauses = [int(random.uniform(*pause) * 1000) for _ in stops]
+    await page.evaluate(_SCROLL_JS, [list(stops), pauses])
+
+
+async def block_resources(ctx, types: frozenset = BLOCKED_RESOURCE_TYPES) -> None:
+    """Abort requests of the given resource types and to ad/analytics hosts.
+
+    Routed on the context, so every page it opens is covered by one handler.
+    """
+    async def _router(route):
+        req = route.request
+        if req.resource_type in types or _BLOCKED_HOSTS_RE.search(req.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await ctx.route("**/*", _router)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Shared HTML backend for the BS4-style scrapers.
+
+selectolax's Lexbor parser builds the tree and runs CSS in C; BeautifulSoup
+(lxml) with precompiled soupsieve selectors is the fallback when selectolax
+is not installed.
+
+  parse_html / compile_selector / css_first / css_all / node_text /
+  node_attr / page_text — thin per-backend functions for hot card parsers
+  HtmlNode — wrapper with one select/select_one/text/attr API, returned by
+  BaseScraper.fetch() so subclasses work the same on either backend
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    LEXBOR_AVAILABLE = True
+except ImportError:
+    LEXBOR_AVAILABLE = False
+
+
+# ── Per-backend primitives ───────────────────────────────────────────────────
+# Selectors passed to css_first/css_all must come from compile_selector():
+# a plain string under Lexbor, a compiled soupsieve pattern under BS4.
+
+if LEXBOR_AVAILABLE:
+    def compile_selector(selector: str):
+        return selector
+
+    def parse_html(html: str):
+        return LexborHTMLParser(html)
+
+    def css_first(node, pat):
+        return node.css_first(pat)
+
+    def css_all(node, pat) -> list:
+        return node.css(pat)
+
+    def node_text(el, separator: str = "") -> str:
+        return el.text(separator=separator, strip=True) if el else ""
+
+    def node_attr(el, name: str) -> Optional[str]:
+        return el.attributes.get(name)
+
+    def page_text(tree) -> str:
+        return (tree.body or tree.root).text(separator=" ", strip=True)
+else:
+    import soupsieve as sv
+    from bs4 import BeautifulSoup
+
+    compile_selector = sv.compile
+
+    def parse_html(html: str):
+        return BeautifulSoup(html, "lxml")
+
+    def css_first(node, pat):
+        return pat.select_one(node)
+
+    def css_all(node, pat) -> list:
+        return pat.select(node)
+
+    def node_text(el, separator: str = "") -> str:
+        return el.get_text(separator, strip=True) if el else ""
+
+    def node_attr(el, name: str) -> Optional[str]:
+        return el.get(name)
+
+    def page_text(tree) -> str:
+        return tree.get_text(" ", strip=True)
+
+
+# ── Backend-neutral wrapper ──────────────────────────────────────────────────
+
+class HtmlNode:
+    """A parsed document or element with the same API on either backend.
+
+    get_text(), get() and [] mirror BeautifulSoup, so scrapers written
+    against BS4 keep working when selectolax is installed.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw):
+        self.raw = raw   # the underlying Lexbor or BeautifulSoup node
+
+    @classmethod
+    def parse(cls, html: str) -> "HtmlNode":
+        return cls(parse_html(html))
+
+    def select_one(self, selector: str) -> Optional["HtmlNode"]:
+        found = css_first(self.raw, compile_selector(selector))
+        return HtmlNode(found) if found is not None else None
+
+    def select(self, selector: str) -> List["HtmlNode"]:
+        return [HtmlNode(n) for n in css_all(self.raw, compile_selector(selector))]
+
+    def text(self, separator: str = "") -> str:
+        """Stripped text content."""
+        return node_text(self.raw, separator)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = node_attr(self.raw, name)
+        return default if value is None else value
+
+    # BeautifulSoup-compatible aliases
+
+    def get_text(self, separator: str = "", strip: bool = True) -> str:
+        """Always stripped; `strip` is accepted for BS4 call compatibility."""
+        return self.text(separator)
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.attr(name, default)
+
+    def __getitem__(self, name: str) -> str:
+        value = node_attr(self.raw, name)
+        if value is None:
+            raise KeyError(name)
+        return value
@@ -20,14 +20,16 @@ import re
 import time
 import random
 from typing import List, Tuple, Optional, Dict
-from urllib.parse import quote_plus, urlparse
+from urllib.parse import parse_qs, quote_plus, urlencode, urlparse
 
-from groq import Groq as _Groq
 from groq import APIConnectionError as _GroqConnectionError
+from playwright.async_api import async_playwright
 
 from app.schemas import RawListing, SiteStatus, SiteStatusCode
 from app.marketplaces.registry import marketplace_registry, MarketplaceConfig
 from app.config import settings
+from app.scraping.browser import scroll_for_lazy_load
+from app.utils.llm_client import chat_completion
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -154,21 +156,16 @@ _USER_AGENTS = [
 ]
 
 
-# ── Groq client (singleton) ─────────────────────────────────────────────────
+# ── Groq key check ───────────────────────────────────────────────────────────
+# Calls go through llm_client.chat_completion (shared client, concurrency cap
+# and retries); this only turns a missing key into a clear per-site error.
 
-_groq_client: Optional[_Groq] = None
-
-def _get_groq_client() -> _Groq:
-    global _groq_client
-    if _groq_client is None:
-        key = (settings.groq_api_key or "").strip()
-        if not key:
-            raise ValueError(
-                "GROQ_API_KEY is not set in .env — cannot call Groq LLM. "
-                "Get a free key at https://console.groq.com and add it to your .env file."
-            )
-        _groq_client = _Groq(api_key=key)
-    return _groq_client
+def _require_groq_key() -> None:
+    if not (settings.groq_api_key or "").strip():
+        raise ValueError(
+            "GROQ_API_KEY is not set in .env — cannot call Groq LLM. "
+            "Get a free key at https://console.groq.com and add it to your .env file."
+        )
 
 
 # ── Noise removal patterns ──────────────────────────────────────────────────
@@ -198,6 +195,13 @@ _NOISE_PATTERNS = [
 ]
 
 
+# Product-identifying query params kept in [URL:...] markers (lower-cased)
+_URL_KEEP_KEYS = frozenset({
+    "pid", "productid", "itemid", "skuid", "id", "product_id",
+    "item_id", "sku", "q",
+})
+
+
 def _build_llm_input(page_text: str, word_budget: int) -> str:
     """Clean and truncate page text for LLM. Keeps [URL:...] markers."""
     text = page_text
@@ -214,14 +218,9 @@ def _build_llm_input(page_text: str, word_budget: int) -> str:
             path = parsed.path
             if parsed.query:
                 # Keep only product-identifying query params, drop tracking noise
-                from urllib.parse import parse_qs, urlencode
-                keep_keys = {
-                    "pid", "productid", "itemid", "skuid", "id", "product_id",
-                    "item_id", "sku", "q", "productId", "itemId", "skuId",
-                }
                 qs = parse_qs(parsed.query)
                 kept = {k: v[0] for k, v in qs.items()
-                        if k.lower() in {x.lower() for x in keep_keys}}
+                        if k.lower() in _URL_KEEP_KEYS}
                 if kept:
                     path = f"{path}?{urlencode(kept)}"
             # Keep up to 250 chars (product URLs can be long on Indian sites)
@@ -311,12 +310,12 @@ _SYSTEM_PROMPT = (
 )
 
 
-def _run_extraction(text: str, prompt: str, max_output_tokens: int) -> dict:
-    """Direct Groq API call for product extraction."""
-    client = _get_groq_client()
+async def _run_extraction(text: str, prompt: str, max_output_tokens: int) -> dict:
+    """Groq API call for product extraction."""
+    _require_groq_key()
     user_content = f"{prompt}\n\n--- PAGE TEXT START ---\n{text}\n--- PAGE TEXT END ---"
 
-    resp = client.chat.completions.create(
+    resp = await chat_completion(
         model="llama-3.1-8b-instant",
         messages=[
             {"role": "system", "content": _SYSTEM_PROMPT},
@@ -513,8 +512,6 @@ async def _fetch_html_playwright(
     ready_selector_matched is True when ready_selector was found on the page,
     False if it timed out, or True when no ready_selector was provided.
     """
-    from playwright.async_api import async_playwright
-
     html = ""
     selector_matched = True  # assume OK if no selector configured
     ua = random.choice(_USER_AGENTS)
@@ -599,11 +596,7 @@ async def _fetch_html_playwright(
             await asyncio.sleep(wait_time + random.uniform(0.5, 1.5))
 
             # Scroll down slowly (mimics human) to trigger lazy-loaded products
-            for scroll_pct in [0.3, 0.5, 0.7, 0.9]:
-                await page.evaluate(
-                    f"window.scrollTo(0, document.body.scrollHeight * {scroll_pct})"
-                )
-                await asyncio.sleep(0.5 + random.uniform(0.2, 0.6))
+            await scroll_for_lazy_load(page, (0.3, 0.5, 0.7, 0.9), pause=(0.7, 1.1))
 
             # Scroll back up a bit (human behavior)
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.2)")
@@ -872,10 +865,7 @@ async def scrape_one_site(
 
             # LLM extraction
             prompt = _build_prompt(search_query, max_results)
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, _run_extraction, text, prompt, _MAX_OUTPUT_TOKENS
-            )
+            result = await _run_extraction(text, prompt, _MAX_OUTPUT_TOKENS)
 
             listings = _parse_result(result, config)
 
@@ -912,7 +902,7 @@ async def scrape_one_site(
             return [], status  # Don't retry — key won't fix itself
 
         except ValueError as err:
-            # Raised by our own _get_groq_client validation
+            # Raised by our own _require_groq_key validation
             status.status  = SiteStatusCode.ERROR
             status.message = str(err)[:120]
             logger.error("[%s] %s", config.key, str(err)[:120])
@@ -958,7 +948,7 @@ _BROWSER_SEMAPHORE: Optional[asyncio.Semaphore] = None
 def _get_browser_semaphore() -> asyncio.Semaphore:
     global _BROWSER_SEMAPHORE
     if _BROWSER_SEMAPHORE is None:
-        _BROWSER_SEMAPHORE = asyncio.Semaphore(3)
+        _BROWSER_SEMAPHORE = asyncio.Semaphore(max(1, settings.scraper_max_concurrent))
     return _BROWSER_SEMAPHORE
 
 
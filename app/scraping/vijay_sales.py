@@ -18,7 +18,7 @@ from bs4 import BeautifulSoup
 
 from app.schemas import RawListing, SiteStatus, SiteStatusCode
 from app.scraping.base import parse_price, parse_rating
-from app.config import settings
+from app.scraping.browser import block_resources, get_browser, scroll_for_lazy_load
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -164,67 +164,49 @@ class VijaySalesScraper:
     # ── Playwright fetch ─────────────────────────────────────────────────
 
     async def _fetch_with_playwright(self, url: str, attempt: int) -> str:
-        from playwright.async_api import async_playwright
-
         ua = random.choice(_USER_AGENTS)
+        ctx = None
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=settings.playwright_headless,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-infobars",
-                        "--no-first-run",
-                        "--no-default-browser-check",
-                        "--disable-dev-shm-usage",
-                        "--disable-gpu",
-                        "--no-sandbox",
-                    ],
-                )
-                ctx = await browser.new_context(
-                    user_agent=ua,
-                    viewport={"width": 1366, "height": 768},
-                    locale="en-IN",
-                    timezone_id="Asia/Kolkata",
-                    bypass_csp=True,
-                    extra_http_headers={
-                        "Accept-Language": "en-IN,en;q=0.9",
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    },
-                )
-                await ctx.add_init_script(_STEALTH_JS)
-                page = await ctx.new_page()
-
-                # Block heavy resources
-                await page.route(
-                    "**/*",
-                    lambda route: route.abort()
-                    if route.request.resource_type in ("font", "media", "image")
-                    else route.continue_(),
-                )
-
-                logger.info("[VijaySalesScraper] Navigating (attempt %d): %s",
-                            attempt, url[:80])
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                await asyncio.sleep(4.0 + random.uniform(0.5, 1.5))
-
-                # Scroll to trigger lazy loading
-                for pct in [0.3, 0.5, 0.7]:
-                    await page.evaluate(
-                        f"window.scrollTo(0, document.body.scrollHeight * {pct})"
-                    )
-                    await asyncio.sleep(0.4 + random.uniform(0.1, 0.4))
-
-                html = await page.content()
-                logger.info("[VijaySalesScraper] Got %d chars of HTML", len(html))
-
-                await browser.close()
-                return html
+            # Shared browser; only the context is per-fetch
+            browser = await get_browser()
+            ctx = await browser.new_context(
+                user_agent=ua,
+                viewport={"width": 1366, "height": 768},
+                locale="en-IN",
+                timezone_id="Asia/Kolkata",
+                bypass_csp=True,
+                extra_http_headers={
+                    "Accept-Language": "en-IN,en;q=0.9",
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                },
+            )
+            await ctx.add_init_script(_STEALTH_JS)
+            # Block heavy resources and trackers
+            await block_resources(ctx)
+            page = await ctx.new_page()
+
+            logger.info("[VijaySalesScraper] Navigating (attempt %d): %s",
+                        attempt, url[:80])
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            await asyncio.sleep(4.0 + random.uniform(0.5, 1.5))
+
+            # Scroll to trigger lazy loading
+            await scroll_for_lazy_load(page)
+
+            html = await page.content()
+            logger.info("[VijaySalesScraper] Got %d chars of HTML", len(html))
+            return html
 
         except Exception as e:
             logger.error("[VijaySalesScraper] Playwright error (attempt %d): %s",
                          attempt, str(e)[:120])
             return ""
+        finally:
+            if ctx is not None:
+                try:
+                    await ctx.close()
+                except Exception:
+                    pass
 
     # ── BS4 parsing ──────────────────────────────────────────────────────
 
@@ -8,9 +8,9 @@ parallel merge, with a custom reducer that supports reset on retry.
 """
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional, TypedDict
+from typing import Annotated, List, TypedDict
 
-from app.schemas import NormalizedProduct, RawListing, NormalizedOffer, SiteStatus
+from app.schemas import NormalizedProduct, NormalizedOffer
 
 
 # ── Custom reducer ────────────────────────────────────────────────────────────
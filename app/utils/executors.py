@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Dedicated thread pool for blocking HTTP calls.
+
+Keeps requests-based scraper work out of the event loop's shared default
+executor, so a burst of scrapes cannot starve other blocking work.
+
+  get_http_pool() — blocking HTTP clients (requests-based scrapers)
+
+Groq calls are async and bounded by llm_client.chat_completion's semaphore,
+so they need no pool. The pool is created on first use and dropped by
+shutdown_pools(), so the next lifespan startup in the same process gets a
+fresh one.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+_HTTP_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def get_http_pool() -> ThreadPoolExecutor:
+    global _HTTP_POOL
+    if _HTTP_POOL is None:
+        _HTTP_POOL = ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix="http",
+        )
+    return _HTTP_POOL
+
+
+def shutdown_pools() -> None:
+    """Release worker threads. Call from lifespan shutdown."""
+    global _HTTP_POOL
+    if _HTTP_POOL is not None:
+        _HTTP_POOL.shutdown(wait=False, cancel_futures=True)
+        _HTTP_POOL = None
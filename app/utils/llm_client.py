@@ -1,44 +1,154 @@
 from __future__ import annotations
-import asyncio, json, re
-from functools import partial
+import asyncio, functools, json, random, re
 from typing import Optional, Dict
+
+import httpx
+from groq import APIConnectionError, APIStatusError, AsyncGroq
+
 from app.config import settings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# ── Shared HTTP/2 transport + AsyncGroq client ───────────────────────────────
+# One pooled connection set for every Groq call in the process, created on
+# first use.  The transport retries connect errors; with_retry below covers
+# what the SDK's own retry loop did (429, 408, 409, 5xx, timeouts), so that
+# loop is disabled (max_retries=0) to avoid double waits.
+
+_http: Optional[httpx.AsyncClient] = None
+_async_groq: Optional[AsyncGroq] = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _http
+
+
+def get_async_groq() -> AsyncGroq:
+    """Shared AsyncGroq client bound to the pooled HTTP/2 transport."""
+    global _async_groq
+    if _async_groq is None:
+        _async_groq = AsyncGroq(
+            api_key=settings.groq_api_key,
+            http_client=_get_http(),
+            max_retries=0,
+        )
+    return _async_groq
+
+
+async def close_http_client() -> None:
+    """Close the shared Groq HTTP client. Call from lifespan shutdown.
+
+    The client, the AsyncGroq wrapper and the loop-bound semaphore are all
+    dropped, so the next startup in the same process builds fresh ones.
+    """
+    global _http, _async_groq, _llm_semaphore
+    client, _http = _http, None
+    _async_groq = None
+    _llm_semaphore = None
+    if client is not None:
+        await client.aclose()
+
+
+# Same attempt count and status set as the SDK's default retry loop
+_RETRY_ATTEMPTS = 3
+_RETRY_STATUSES = {408, 409, 429}
+
+
+def _is_retryable(err: Exception) -> bool:
+    if isinstance(err, APIStatusError):
+        return err.status_code in _RETRY_STATUSES or err.status_code >= 500
+    return isinstance(err, APIConnectionError)   # includes APITimeoutError
+
+
+def _retry_delay(err: Exception, attempt: int) -> float:
+    """Honour Retry-After when Groq sends it, else exponential backoff; add jitter."""
+    retry_after = None
+    response = getattr(err, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+    try:
+        base = float(retry_after)
+    except (TypeError, ValueError):
+        base = 2.0 ** attempt
+    return base + random.uniform(0.1, 1.0)
+
+
+def with_retry(fn):
+    """Retry an async Groq call on 429, 408, 409, 5xx and timeouts with backoff + jitter."""
+
+    @functools.wraps(fn)
+    async def _wrapper(*args, **kwargs):
+        for attempt in range(1, _RETRY_ATTEMPTS + 1):
+            try:
+                return await fn(*args, **kwargs)
+            except (APIStatusError, APIConnectionError) as err:
+                if attempt == _RETRY_ATTEMPTS or not _is_retryable(err):
+                    raise
+                wait = _retry_delay(err, attempt)
+                logger.warning(
+                    "Groq %s (attempt %d/%d) — retrying in %.1fs",
+                    getattr(err, "status_code", type(err).__name__),
+                    attempt, _RETRY_ATTEMPTS, wait,
+                )
+                await asyncio.sleep(wait)
+
+    return _wrapper
+
+
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    # Created lazily so it binds to the running loop, not the import-time one
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(max(1, settings.llm_max_concurrent))
+    return _llm_semaphore
+
+
+@with_retry
+async def chat_completion(**kwargs):
+    """chat.completions.create on the shared AsyncGroq client, with retries.
+
+    Every Groq call in the process (pipeline agents, page extraction,
+    chatbot and watchlist emails) takes a slot from one
+    LLM_MAX_CONCURRENT-sized semaphore.  The slot is held for the request
+    only, not across a retry back-off sleep.
+    """
+    async with _get_llm_semaphore():
+        return await get_async_groq().chat.completions.create(**kwargs)
+
+
 class GroqLLMClient:
     """
     Unified Groq client.
     - primary_model (70B): query parsing, matching, selector discovery, explanation
     - fast_model    (8B): per-card extraction (many parallel calls)
-    Semaphore respects Groq free-tier: 30 req/min → max 3 concurrent
+    chat_completion() caps in-flight calls at LLM_MAX_CONCURRENT (Groq free-tier: 30 req/min).
     """
 
     def __init__(self):
         self.enabled       = settings.llm_enabled and bool(settings.groq_api_key)
         self.primary_model = settings.groq_primary_model
         self.fast_model    = settings.groq_fast_model
-        self._client       = None
-        self._semaphore    = None   # lazily initialized (needs running event loop)
 
         if self.enabled:
             logger.info(f"✓ Groq LLM | primary={self.primary_model} | fast={self.fast_model}")
         else:
             logger.warning("⚠ LLM disabled — set GROQ_API_KEY + LLM_ENABLED=true in .env")
 
-    def _get_semaphore(self):
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(settings.llm_max_concurrent)
-        return self._semaphore
-
-    def _get_client(self):
-        if not self._client:
-            from groq import Groq
-            self._client = Groq(api_key=settings.groq_api_key)
-        return self._client
-
     async def complete_json(
         self,
         system:         str,
@@ -50,33 +160,23 @@ class GroqLLMClient:
 
         model = self.fast_model if use_fast_model else self.primary_model
 
-        async with self._get_semaphore():
-            try:
-                loop     = asyncio.get_event_loop()
-                client   = self._get_client()
-                response = await loop.run_in_executor(
-                    None,
-                    partial(
-                        client.chat.completions.create,
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": system},
-                            {"role": "user",   "content": user},
-                        ],
-                        response_format={"type": "json_object"},
-                        temperature=0.0,
-                        max_tokens=1024,
-                    )
-                )
-                raw = response.choices[0].message.content
-                return self._parse_json(raw)
-
-            except Exception as e:
-                err = str(e)
-                logger.error(f"Groq JSON [{model}]: {err[:80]}")
-                if "rate_limit" in err.lower() or "429" in err:
-                    await asyncio.sleep(5)
-                return None
+        try:
+            response = await chat_completion(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user",   "content": user},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.0,
+                max_tokens=1024,
+            )
+            raw = response.choices[0].message.content
+            return self._parse_json(raw)
+
+        except Exception as e:
+            logger.error(f"Groq JSON [{model}]: {str(e)[:80]}")
+            return None
 
     async def complete_text(
         self,
@@ -90,27 +190,20 @@ class GroqLLMClient:
 
         model = self.fast_model if use_fast_model else self.primary_model
 
-        async with self._get_semaphore():
-            try:
-                loop     = asyncio.get_event_loop()
-                client   = self._get_client()
-                response = await loop.run_in_executor(
-                    None,
-                    partial(
-                        client.chat.completions.create,
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": system},
-                            {"role": "user",   "content": user},
-                        ],
-                        temperature=0.2,
-                        max_tokens=max_tokens,
-                    )
-                )
-                return response.choices[0].message.content.strip()
-            except Exception as e:
-                logger.error(f"Groq text [{model}]: {str(e)[:80]}")
-                return None
+        try:
+            response = await chat_completion(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user",   "content": user},
+                ],
+                temperature=0.2,
+                max_tokens=max_tokens,
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"Groq text [{model}]: {str(e)[:80]}")
+            return None
 
     def _parse_json(self, text: str) -> Optional[Dict]:
         if not text:
@@ -26,17 +26,17 @@ logger = get_logger(__name__)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def _generate_ai_message(product_title: str, site: str, price: float, threshold: float) -> str:
+async def generate_ai_message(product_title: str, site: str, price: float, threshold: float) -> str:
     """Generate a short AI description for the watchlist confirmation email.
 
-    Uses Groq synchronously (called in executor). Falls back to static text.
+    Goes through llm_client.chat_completion, so it shares the process-wide
+    Groq concurrency cap. Falls back to static text.
     """
     try:
-        from groq import Groq
+        from app.utils.llm_client import chat_completion
         if not settings.groq_api_key:
             raise ValueError("No API key")
 
-        client = Groq(api_key=settings.groq_api_key)
         prompt = (
             f"Write a short (2-3 sentences), friendly, enthusiastic message for a user who just "
             f"added a product to their price watchlist. Product: '{product_title}' from {site} "
@@ -45,7 +45,7 @@ def _generate_ai_message(product_title: str, site: str, price: float, threshold:
             f"the AI monitors prices 24/7. Do NOT use markdown. Do NOT use emojis. "
             f"Keep it under 60 words."
         )
-        response = client.chat.completions.create(
+        response = await chat_completion(
             model=settings.groq_fast_model or "llama-3.1-8b-instant",
             messages=[
                 {"role": "system", "content": "You are a helpful price comparison assistant."},
@@ -60,7 +60,10 @@ def _generate_ai_message(product_title: str, site: str, price: float, threshold:
     except Exception as e:
         logger.warning("AI message generation failed, using fallback: %s", e)
 
-    # Fallback
+    return _fallback_message(product_title, threshold)
+
+
+def _fallback_message(product_title: str, threshold: float) -> str:
     return (
         f"Great choice! We've added {product_title[:50]} to your watchlist. "
         f"Our AI monitors prices around the clock across all major Indian marketplaces. "
@@ -83,7 +86,7 @@ def send_price_drop_email(
     """Send price drop notification email.
 
     NOT async — smtplib is synchronous.
-    Called via: asyncio.get_event_loop().run_in_executor(None, ...)
+    Called via: asyncio.get_running_loop().run_in_executor(None, ...)
 
     Never raises exceptions — scheduler must not crash.
     """
@@ -209,16 +212,17 @@ def send_watchlist_added_email(
     threshold: float,
     product_url: str = "",
     thumbnail_url: str = "",
+    ai_message: str = "",
 ) -> None:
     """Send an AI-generated confirmation email when user adds product to watchlist.
 
-    Sent on EVERY save — not just the first time.
+    Sent on EVERY save — not just the first time. `ai_message` comes from
+    generate_ai_message(), awaited by the caller; empty → static text.
     NOT async. Never raises exceptions.
     """
     try:
-        # Generate AI message
-        ai_message = _generate_ai_message(product_title, site, saved_price, threshold)
-        logger.info("AI message generated for %s", product_title[:40])
+        if not ai_message:
+            ai_message = _fallback_message(product_title, threshold)
 
         title_display = product_title
         if len(title_display) > 65:
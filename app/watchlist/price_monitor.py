@@ -10,7 +10,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 
-from app.graph import graph as comparison_graph
+from app.graph import get_graph
 from app.utils.logger import get_logger
 from app.watchlist.schemas import WatchlistItemResponse
 from app.watchlist.service import (
@@ -60,7 +60,7 @@ async def check_price_for_item(db, item: WatchlistItemResponse) -> None:
             "Price check: running pipeline for '%s' on %s",
             item.product_title[:40], item.site,
         )
-        result = await comparison_graph.ainvoke(initial_state)
+        result = await get_graph().ainvoke(initial_state)
 
         # Step 3: Extract new price for the specific site
         ranked = result.get("ranked_results", [])
@@ -111,7 +111,7 @@ async def check_price_for_item(db, item: WatchlistItemResponse) -> None:
                         )
 
                 if should_notify:
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     await loop.run_in_executor(
                         None,
                         send_price_drop_email,
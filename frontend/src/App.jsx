@@ -264,12 +264,17 @@ function App() {
                         if (eventType === 'scraping_started') {
                             setProgress({ stage: 'scraping', sites: data.sites || [], completedSites: [] })
 
-                        } else if (eventType === 'site_done') {
-                            siteStatuses.push(data)
+                        } else if (eventType === 'site_done' || eventType === 'site_done_batch') {
+                            // site_done_batch carries several statuses: { sites: [...] }
+                            const batch = eventType === 'site_done_batch' ? (data.sites || []) : [data]
+                            siteStatuses.push(...batch)
                             setProgress((prev) => ({
                                 ...prev,
                                 stage: 'scraping',
-                                completedSites: [...(prev?.completedSites || []), data.marketplace_key || data.site || ''],
+                                completedSites: [
+                                    ...(prev?.completedSites || []),
+                                    ...batch.map((s) => s.marketplace_key || s.site || ''),
+                                ],
                             }))
 
                         } else if (eventType === 'matching_done') {